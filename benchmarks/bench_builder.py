@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_builder.py
+
+Builder large-document mode with a 10 MB document: appends, window reads,
+copy (join) and save (streamed chunks) on the TextBuffer; with a display,
+also the cost of an append + re-render in the real window compared with a
+plain word-wrapped tk.Text holding the same document.
+
+    python benchmarks/bench_builder.py
+    xvfb-run -a python benchmarks/bench_builder.py --gui
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mh_special_char_keyboard_core import TextBuffer, save_text  # noqa: E402
+
+DOC_CHARS = 10 * 1024 * 1024
+LINE = "Symbols → ≈ ≠ ± × ÷ “quoted” — π Ω µ € £ ¥ ★ ☆ ✓ ✗ and plain words to wrap around. "
+
+
+def timed(label, fn, per=1):
+    t0 = time.perf_counter()
+    result = fn()
+    dt = time.perf_counter() - t0
+    suffix = f" ({dt / per * 1e6:.2f} µs each)" if per > 1 else ""
+    print(f"  {label:<38} {dt * 1000:9.1f} ms{suffix}")
+    return result
+
+
+def bench_buffer():
+    print(f"TextBuffer, {DOC_CHARS / 1e6:.0f}M characters")
+    doc = TextBuffer()
+    pieces = DOC_CHARS // len(LINE)
+    timed("append in ~90-char bursts", lambda: [doc.append(LINE) for _ in range(pieces)], per=pieces)
+    timed("100k single-character appends", lambda: [doc.append("→") for _ in range(100_000)], per=100_000)
+    starts = [random.randrange(len(doc)) for _ in range(1000)]
+    timed("1000 random 20k-char window reads", lambda: [doc.slice(s, s + 20_000) for s in starts], per=1000)
+    timed("copy all (join)", doc.getvalue)
+    with tempfile.TemporaryDirectory() as tmp:
+        timed("save (stream chunks)", lambda: save_text(os.path.join(tmp, "doc.txt"), doc.chunks()))
+    return doc
+
+
+def bench_gui(doc):
+    import tkinter as tk
+    from mh_special_char_keyboard_gui import SpecialCharKeyboard
+
+    print("Window, same document")
+    app = SpecialCharKeyboard()
+    app.update()
+    app.large_doc_var.set(True)
+    app._enter_large_doc()
+    app._doc = doc
+    app._doc_render(len(doc))
+    app.update()
+
+    def append_burst():
+        for _ in range(100):
+            app._append_symbol("★")
+            app._flush_appends()
+            app.update_idletasks()
+    timed("100 appends + re-render (large mode)", append_burst, per=100)
+    timed("scroll to 50% (large mode)", lambda: (app._doc_scroll("moveto", 0.5), app.update_idletasks()))
+
+    plain = tk.Text(app, wrap=tk.WORD)
+    plain.pack()
+    timed("load into plain word-wrapped Text", lambda: (plain.insert("1.0", doc.getvalue()), app.update_idletasks()))
+
+    def plain_appends():
+        for _ in range(100):
+            plain.insert(tk.END, "★")
+            plain.see(tk.END)
+            app.update_idletasks()
+    timed("100 appends (plain Text)", plain_appends, per=100)
+    timed("get all (plain Text)", lambda: plain.get("1.0", tk.END))
+    app.destroy()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Builder large-document benchmark.")
+    parser.add_argument("--gui", action="store_true", help="also measure the real window (needs a display)")
+    args = parser.parse_args(argv)
+    doc = bench_buffer()
+    if args.gui:
+        bench_gui(doc)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_search.py
+
+Compares the original linear ``unicodedata.name`` substring scan, the
+token index (NameIndex.search) and the ranked fuzzy search
+(NameIndex.ranked, top 200) at 500, 10k and 150k symbols, then shows what
+each finds for misspelled and abbreviated queries over the whole
+repertoire. No display is needed.
+
+    python benchmarks/bench_search.py [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import time
+import unicodedata
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mh_special_char_keyboard_search import NameIndex  # noqa: E402
+
+SIZES = (500, 10_000, 150_000)
+QUERIES = ("arrow", "left arrow", "greek small", "latin capital letter a", "box drawings light", "€", "zzz")
+FUZZY_QUERIES = ("lefft arow", "grek smal alpha", "rightwrds arrow", "eruo sign", "lsqm", "bdl")
+TOP_K = 200
+
+
+def repertoire(limit):
+    chars = []
+    for cp in range(0x110000):
+        ch = chr(cp)
+        if unicodedata.category(ch) not in ("Cc", "Cs", "Co", "Cn"):
+            chars.append(ch)
+    # repeat the repertoire if a size beyond it is requested
+    while len(chars) < limit:
+        chars += chars[:limit - len(chars)]
+    return chars[:limit]
+
+
+def linear_scan(chars, q):
+    """The search loop previously inlined in SpecialCharKeyboard._do_search."""
+    results = []
+    for ch in chars:
+        name = ""
+        try:
+            name = unicodedata.name(ch).lower()
+        except ValueError:
+            pass
+        if q in ch.lower() or (name and q in name):
+            results.append(ch)
+    return results
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement (best is kept)")
+    args = parser.parse_args(argv)
+
+    all_chars = repertoire(max(SIZES))
+    print(f"{'symbols':>8}  {'build ms':>9}  {'fuzzy build ms':>15}  {'scan ms/query':>14}  "
+          f"{'index ms/query':>15}  {'ranked ms/query':>16}")
+    for size in SIZES:
+        chars = all_chars[:size]
+        t0 = time.perf_counter()
+        index = NameIndex(chars)
+        build = time.perf_counter() - t0
+        # typo and acronym tables are built on the first ranked query that needs them
+        fuzzy_build = timed(lambda: (index.ranked("xxxx"), index.ranked("xx")), 1)
+        scan = sum(timed(lambda q=q: linear_scan(chars, q), args.repeat) for q in QUERIES) / len(QUERIES)
+        indexed = sum(timed(lambda q=q: index.search(q), args.repeat) for q in QUERIES) / len(QUERIES)
+        ranked = sum(timed(lambda q=q: index.ranked(q, TOP_K), args.repeat)
+                     for q in QUERIES + FUZZY_QUERIES) / len(QUERIES + FUZZY_QUERIES)
+        print(f"{size:>8}  {build * 1000:>9.1f}  {fuzzy_build * 1000:>15.1f}  {scan * 1000:>14.3f}  "
+              f"{indexed * 1000:>15.3f}  {ranked * 1000:>16.3f}")
+
+    print(f"\nMisspelled / abbreviated queries, {len(all_chars)} symbols (hits: scan / index / ranked):")
+    for q in FUZZY_QUERIES:
+        ranked = index.ranked(q, TOP_K)
+        top = unicodedata.name(chars[ranked[0]]) if ranked else "-"
+        print(f"  {q!r:<20} {len(linear_scan(chars, q)):>5} / {len(index.search(q)):>5} / {len(ranked):>5}   best: {top}")
+
+
+if __name__ == "__main__":
+    main()
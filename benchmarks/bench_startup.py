@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_startup.py
+
+Startup profile of the GUI: cold and warm start, time to first interactive
+(process spawn -> first idle of the event loop), the per-phase timings
+recorded by SpecialCharKeyboard._mark, import times and peak RSS. Results
+are written as JSON; with --baseline the run fails (exit 1) when the warm
+median is slower or bigger than the baseline by more than --tolerance.
+
+Needs a display; on CI / headless machines run it under Xvfb:
+
+    xvfb-run -a python benchmarks/bench_startup.py --runs 10 --output bench_startup.json
+    xvfb-run -a python benchmarks/bench_startup.py --baseline bench_startup.json
+
+"Cold" runs use an empty bytecode cache (-X pycache_prefix=<new dir>), so
+every module, stdlib included, is compiled; "warm" runs reuse the normal
+__pycache__ after a priming run. The OS file cache is not dropped.
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs inside the child interpreter; prints one JSON object.
+PROBE = r"""
+import json, os, sys, time
+t0 = time.perf_counter()
+spawned = float(os.environ["MH_BENCH_SPAWNED"])
+import tkinter
+t_tk = time.perf_counter()
+import mh_special_char_keyboard_gui as gui
+t_app = time.perf_counter()
+app = gui.SpecialCharKeyboard()
+t_init = time.perf_counter()
+result = {}
+
+def ready():
+    result["tti_ms"] = (time.time() - spawned) * 1000
+    result["first_idle_ms"] = (time.perf_counter() - t_init) * 1000
+    app.destroy()
+
+app.after_idle(ready)
+app.mainloop()
+try:
+    import resource
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    rss = rss // 1024 if sys.platform == "darwin" else rss
+except ImportError:  # Windows
+    rss = None
+prev, phases = 0.0, {}
+for phase, t in app.startup_phases:
+    phases[phase] = (t - prev) * 1000
+    prev = t
+result.update(
+    import_tkinter_ms=(t_tk - t0) * 1000,
+    import_app_ms=(t_app - t_tk) * 1000,
+    init_ms=(t_init - t_app) * 1000,
+    phases_ms=phases,
+    peak_rss_kb=rss,
+)
+print(json.dumps(result))
+"""
+
+REGRESSION_METRICS = ("tti_ms", "init_ms", "peak_rss_kb")
+
+
+def run_probe(extra_args=()):
+    env = dict(os.environ, MH_BENCH_SPAWNED=repr(time.time()))
+    env["PYTHONPATH"] = ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    t0 = time.perf_counter()
+    proc = subprocess.run([sys.executable, *extra_args, "-c", PROBE], cwd=ROOT, env=env,
+                          capture_output=True, text=True)
+    wall = (time.perf_counter() - t0) * 1000
+    if proc.returncode != 0:
+        sys.exit(f"probe failed:\n{proc.stderr}")
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["wall_ms"] = wall
+    return result
+
+
+def import_profile(top=12):
+    """Slowest imports (cumulative microseconds) from ``python -X importtime``."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import mh_special_char_keyboard_gui"],
+                          cwd=ROOT, capture_output=True, text=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        m = re.match(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)", line)
+        if m:
+            rows.append({"module": m.group(4), "self_us": int(m.group(1)),
+                         "cumulative_us": int(m.group(2)), "depth": len(m.group(3)) // 2})
+    return sorted(rows, key=lambda r: r["cumulative_us"], reverse=True)[:top]
+
+
+def summarize(samples):
+    keys = [k for k, v in samples[0].items() if isinstance(v, (int, float))]
+    phases = samples[0]["phases_ms"].keys()
+    return {
+        "median": {k: statistics.median(s[k] for s in samples) for k in keys},
+        "min": {k: min(s[k] for s in samples) for k in keys},
+        "phases_median_ms": {p: statistics.median(s["phases_ms"][p] for s in samples) for p in phases},
+    }
+
+
+def check_regressions(report, baseline, tolerance):
+    failures = []
+    for metric in REGRESSION_METRICS:
+        old = baseline["warm"]["median"].get(metric)
+        new = report["warm"]["median"].get(metric)
+        if old and new and new > old * (1 + tolerance):
+            failures.append(f"{metric}: {old:.1f} -> {new:.1f} (+{(new / old - 1) * 100:.0f}%)")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Startup profile of the Special Character Keyboard GUI.")
+    parser.add_argument("--runs", type=int, default=5, help="warm runs (default: 5)")
+    parser.add_argument("--output", default="bench_startup.json", help="JSON results file")
+    parser.add_argument("--baseline", help="earlier results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown vs baseline (default: 0.25)")
+    args = parser.parse_args(argv)
+
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+        sys.exit("No DISPLAY; run under Xvfb, e.g.: xvfb-run -a python benchmarks/bench_startup.py")
+    baseline = None
+    if args.baseline:  # read first: --output may point at the same file
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    with tempfile.TemporaryDirectory() as empty_cache:
+        cold = run_probe(["-X", f"pycache_prefix={empty_cache}"])
+    run_probe()  # prime __pycache__
+    warm = [run_probe() for _ in range(args.runs)]
+
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cold": cold,
+        "warm": dict(summarize(warm), runs=args.runs, samples=warm),
+        "imports": import_profile(),
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    med = report["warm"]["median"]
+    print(f"cold: tti {cold['tti_ms']:.0f} ms, wall {cold['wall_ms']:.0f} ms")
+    print(f"warm (median of {args.runs}): tti {med['tti_ms']:.0f} ms, import tkinter {med['import_tkinter_ms']:.1f} ms, "
+          f"import app {med['import_app_ms']:.1f} ms, __init__ {med['init_ms']:.1f} ms, "
+          f"peak RSS {med.get('peak_rss_kb', 0):.0f} KiB")
+    for phase, ms in report["warm"]["phases_median_ms"].items():
+        print(f"  {phase:<14} {ms:7.1f} ms")
+    print(f"wrote {args.output}")
+
+    if baseline is not None:
+        failures = check_regressions(report, baseline, args.tolerance)
+        for failure in failures:
+            print(f"REGRESSION {failure}")
+        return 1 if failures else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
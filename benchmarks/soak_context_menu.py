@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+soak_context_menu.py
+
+Pops the symbol context menu up many times (and runs one of its actions
+now and then) against a live window, and checks that the Tk widget count
+and the process RSS stay flat. Needs a display (use ``xvfb-run`` on
+headless machines). Exits with status 1 if anything keeps growing after
+the warm-up.
+
+    xvfb-run python benchmarks/soak_context_menu.py [--popups N]
+"""
+
+import argparse
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mh_special_char_keyboard_core import symbol_table  # noqa: E402
+from mh_special_char_keyboard_gui import SpecialCharKeyboard  # noqa: E402
+from soak_search_tab import RSS_SLACK_KB, rss_kb, widget_count  # noqa: E402
+
+WARMUP = 200
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--popups", type=int, default=5_000)
+    args = parser.parse_args(argv)
+
+    app = SpecialCharKeyboard()
+    app.update()
+    symbols = symbol_table().symbols
+    event = SimpleNamespace(x_root=app.winfo_rootx() + 40, y_root=app.winfo_rooty() + 40)
+    copy_code_point = app._symbol_menu().index("Copy Code Point (U+…)")
+    baseline = None
+    for n in range(args.popups):
+        app._context_menu(event, symbols[n % len(symbols)])
+        if n % 10 == 0:
+            app._menu.invoke(copy_code_point)
+        app._menu.unpost()
+        if n % 50 == 0:
+            app.update()
+        if n == WARMUP:
+            app.update()
+            baseline = widget_count(app), rss_kb()
+    app.update()
+    final = widget_count(app), rss_kb()
+    app.destroy()
+
+    print(f"popups:       {args.popups}")
+    print(f"widgets:      {baseline[0]} -> {final[0]}")
+    print(f"rss (KiB):    {baseline[1]} -> {final[1]}")
+    ok = final[0] <= baseline[0] and final[1] <= baseline[1] + RSS_SLACK_KB
+    print("OK" if ok else "FAIL: resources grew during the soak")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+soak_search_tab.py
+
+Runs many searches against a live window and checks that the Tk widget
+count, the canvas item count and the process RSS stay bounded. Needs a
+display (use ``xvfb-run`` on headless machines). Exits with status 1 if
+anything keeps growing after the warm-up.
+
+    xvfb-run python benchmarks/soak_search_tab.py [--searches N]
+"""
+
+import argparse
+import os
+import resource
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mh_special_char_keyboard_gui import SpecialCharKeyboard  # noqa: E402
+
+QUERIES = ("arrow", "left", "greek", "latin small", "box", "star", "sign", "x", "quotation", "e")
+WARMUP = 200
+RSS_SLACK_KB = 4096
+
+
+def widget_count(widget):
+    return 1 + sum(widget_count(child) for child in widget.winfo_children())
+
+
+def canvas_items(widget):
+    own = len(widget.find_all()) if widget.winfo_class() == "Canvas" else 0
+    return own + sum(canvas_items(child) for child in widget.winfo_children())
+
+
+def rss_kb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:  # not Linux: fall back to the peak figure
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def snapshot(app):
+    # measure with the same result set each time so canvas item counts compare
+    app.search_var.set(QUERIES[0])
+    app._do_search()
+    app.update()
+    return widget_count(app), canvas_items(app), rss_kb()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--searches", type=int, default=10_000)
+    args = parser.parse_args(argv)
+
+    app = SpecialCharKeyboard()
+    app.update()
+    baseline = None
+    for n in range(args.searches):
+        app.search_var.set(QUERIES[n % len(QUERIES)])
+        app._do_search()
+        if n % 50 == 0:
+            app.update()
+        if n == WARMUP:
+            baseline = snapshot(app)
+    final = snapshot(app)
+    app.destroy()
+
+    print(f"searches:     {args.searches}")
+    print(f"widgets:      {baseline[0]} -> {final[0]}")
+    print(f"canvas items: {baseline[1]} -> {final[1]}")
+    print(f"rss (KiB):    {baseline[2]} -> {final[2]}")
+    ok = final[0] <= baseline[0] and final[1] <= baseline[1] and final[2] <= baseline[2] + RSS_SLACK_KB
+    print("OK" if ok else "FAIL: resources grew during the soak")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+soak_symbol_grid.py
+
+Scrolls a SymbolGrid holding 100,000 symbols from top to bottom and back
+(line steps, page steps and random jumps) and records the canvas item
+count, the process RSS and the render time of every scroll step. Needs a
+display (use ``xvfb-run`` on headless machines). Exits with status 1 if the
+item count or RSS keeps growing after the warm-up, or if the 95th
+percentile step time is over --budget-ms.
+
+    xvfb-run python benchmarks/soak_symbol_grid.py [--symbols N] [--passes N]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mh_special_char_keyboard_gui import SymbolGrid  # noqa: E402
+from soak_search_tab import RSS_SLACK_KB, rss_kb  # noqa: E402
+
+WARMUP_STEPS = 200
+
+
+def symbols(count):
+    """``count`` distinct single characters (no surrogates, which Tk cannot draw)."""
+    cps = (cp for cp in range(0x2000, 0x110000) if not 0xD800 <= cp <= 0xDFFF)
+    return [chr(cp) for cp, _n in zip(cps, range(count))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=100_000)
+    parser.add_argument("--passes", type=int, default=2, help="top-to-bottom-and-back passes (default: 2)")
+    parser.add_argument("--budget-ms", type=float, default=16.0, help="allowed p95 step time (default: 16)")
+    args = parser.parse_args(argv)
+
+    root = tk.Tk()
+    root.geometry("900x700")
+    grid = SymbolGrid(root, symbols(args.symbols))
+    grid.pack(fill="both", expand=True)
+    root.update()
+
+    times = []
+    baseline = None
+
+    def step(*yview):
+        nonlocal baseline
+        t0 = time.perf_counter()
+        grid._yview(*yview)
+        root.update_idletasks()
+        times.append((time.perf_counter() - t0) * 1000)
+        if len(times) == WARMUP_STEPS:
+            root.update()
+            baseline = len(grid.canvas.find_all()), rss_kb()
+
+    rows = -(-args.symbols // grid._cols)
+    for _ in range(args.passes):
+        for direction in (1, -1):
+            for _ in range(0, rows, 3):  # a mouse-wheel notch at a time
+                step("scroll", direction * 3, "units")
+            for _ in range(20):
+                step("scroll", direction, "pages")
+        for _ in range(500):
+            step("moveto", random.random())
+    root.update()
+    final = len(grid.canvas.find_all()), rss_kb()
+    root.destroy()
+
+    times.sort()
+    p95 = times[int(len(times) * 0.95)]
+    print(f"symbols:      {args.symbols:,} ({grid._cols} columns, {rows:,} rows)")
+    print(f"steps:        {len(times):,}")
+    print(f"step time:    median {statistics.median(times):.2f} ms, p95 {p95:.2f} ms, max {times[-1]:.2f} ms")
+    print(f"canvas items: {baseline[0]} -> {final[0]}")
+    print(f"rss (KiB):    {baseline[1]} -> {final[1]}")
+    ok = final[0] <= baseline[0] and final[1] <= baseline[1] + RSS_SLACK_KB and p95 <= args.budget_ms
+    print("OK" if ok else "FAIL: resources grew or scrolling was over budget")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+mh_special_char_keyboard_cli.py
+
+Command-line bulk lookup and encoding (installed as ``mh-special-char``).
+
+Reads characters, Unicode names or code points from files or stdin and
+streams one record per symbol (char, name, hex, dec, html_dec, html_hex) as
+JSON Lines or CSV. Input is processed line by line (chars mode: in fixed-size
+blocks), so memory use does not depend on input size.
+
+    mh-special-char names.txt                 # auto-detect each line (name or code point)
+    printf 'U+2192\\n0x20AC\\n' | mh-special-char --format csv
+    mh-special-char --mode chars < document.txt
+    mh-special-char --search "left arrow"
+"""
+
+import argparse
+import csv
+import io
+import json
+import re
+import sys
+import unicodedata
+from functools import lru_cache
+
+from mh_special_char_keyboard_core import catalogue_cache, search, symbol_info
+
+FIELDS = ("char", "name", "hex", "dec", "html_dec", "html_hex")
+CHUNK_SIZE = 64 * 1024
+
+_CODEPOINT = re.compile(r"^(?:[Uu]\+|0[xX]|&#[xX])?([0-9A-Fa-f]+);?$|^&#([0-9]+);$")
+
+
+class UnresolvedInput(ValueError):
+    """An input token that does not resolve to a character."""
+
+
+def parse_codepoint(token: str) -> str:
+    """'U+2192', '0x2192', '&#x2192;', '&#8594;' or bare hex '2192' -> character."""
+    m = _CODEPOINT.match(token)
+    if not m:
+        raise UnresolvedInput(f"not a code point: {token!r}")
+    cp = int(m.group(1), 16) if m.group(1) is not None else int(m.group(2))
+    if cp > 0x10FFFF:
+        raise UnresolvedInput(f"code point out of range: {token!r}")
+    if 0xD800 <= cp <= 0xDFFF:
+        raise UnresolvedInput(f"surrogate code point: {token!r}")
+    return chr(cp)
+
+
+def lookup_name(token: str) -> str:
+    try:
+        return unicodedata.lookup(token)
+    except KeyError:
+        raise UnresolvedInput(f"unknown Unicode name: {token!r}") from None
+
+
+def resolve_line(line: str, mode: str):
+    """Characters for one input line; raises UnresolvedInput for unresolvable tokens."""
+    if mode == "codepoints":
+        return [parse_codepoint(tok) for tok in line.split()]
+    if mode == "names":
+        return [lookup_name(line.strip())]
+    # auto: single character, prefixed code point, name, then bare hex;
+    # plain text is not guessed at (use --mode chars)
+    token = line.strip()
+    if len(token) == 1:
+        return [token]
+    if re.match(r"^(?:[Uu]\+|0[xX]|&#)", token):
+        return [parse_codepoint(token)]
+    try:
+        return [unicodedata.lookup(token)]
+    except KeyError:
+        pass
+    try:
+        return [parse_codepoint(token)]
+    except UnresolvedInput:
+        raise UnresolvedInput(f"not a character, code point or Unicode name: {token!r}") from None
+
+
+def iter_inputs(streams, mode):
+    """Yield (input token, char or None, error or None) across all streams."""
+    for stream in streams:
+        if mode == "chars":
+            for block in iter(lambda: stream.read(CHUNK_SIZE), ""):
+                for ch in block:
+                    if ch not in "\r\n":
+                        yield ch, ch, None
+            continue
+        for line in stream:
+            line = line.rstrip("\r\n")
+            if not line.strip():
+                continue
+            try:
+                for ch in resolve_line(line, mode):
+                    yield line, ch, None
+            except UnresolvedInput as e:
+                yield line, None, str(e)
+
+
+def record_for(ch: str) -> dict:
+    info = symbol_info(ch)
+    return {f: getattr(info, f) for f in FIELDS}
+
+
+# Real inputs repeat a small set of symbols, so the formatted output for each
+# symbol is cached too (bounded, like symbol_info itself).
+@lru_cache(maxsize=4096)
+def _json_line(ch: str) -> str:
+    return json.dumps(record_for(ch), ensure_ascii=False) + "\n"
+
+
+@lru_cache(maxsize=4096)
+def _csv_row(ch: str) -> tuple:
+    info = symbol_info(ch)
+    return tuple(getattr(info, f) for f in FIELDS)
+
+
+class JsonLinesWriter:
+    def __init__(self, out):
+        self.out = out
+
+    def header(self):
+        pass
+
+    def write(self, ch):
+        self.out.write(_json_line(ch))
+
+
+class CsvWriter:
+    def __init__(self, out):
+        self.writer = csv.writer(out)
+
+    def header(self):
+        self.writer.writerow(FIELDS)
+
+    def write(self, ch):
+        self.writer.writerow(_csv_row(ch))
+
+
+WRITERS = {"jsonl": JsonLinesWriter, "csv": CsvWriter}
+
+
+def _open_inputs(paths, on_error):
+    """Yield each input stream; files that cannot be opened go to ``on_error(message)``."""
+    if not paths or paths == ["-"]:
+        yield io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", errors="replace")
+        return
+    for path in paths:
+        if path == "-":
+            yield io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", errors="replace")
+            continue
+        try:
+            f = open(path, encoding="utf-8", errors="replace")
+        except OSError as e:
+            on_error(f"cannot open {path}: {e.strerror or e}")
+            continue
+        with f:
+            yield f
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="mh-special-char",
+        description="Look up and encode special characters in bulk.")
+    parser.add_argument("files", nargs="*", help="input files (default: stdin; '-' also means stdin)")
+    parser.add_argument("-f", "--format", choices=sorted(WRITERS), default="jsonl", help="output format (default: jsonl)")
+    parser.add_argument("-m", "--mode", choices=("auto", "chars", "names", "codepoints"), default="auto",
+                        help="how to read input lines (default: auto)")
+    parser.add_argument("-s", "--search", metavar="QUERY", help="output catalogue symbols matching QUERY instead of reading input")
+    parser.add_argument("-o", "--output", help="write to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    out = open(args.output, "w", encoding="utf-8", newline="") if args.output else \
+        io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", newline="")
+    writer = WRITERS[args.format](out)
+    errors = 0
+
+    def report(message):
+        nonlocal errors
+        errors += 1
+        print(f"mh-special-char: {message}", file=sys.stderr)
+
+    catalogue_cache()  # symbol_info only reads the cache once it is loaded
+    try:
+        writer.header()
+        if args.search is not None:
+            for ch in dict.fromkeys(ch for ch, _cat in search(args.search)):
+                writer.write(ch)
+        else:
+            for _token, ch, error in iter_inputs(_open_inputs(args.files, report), args.mode):
+                if error:
+                    report(error)
+                else:
+                    writer.write(ch)
+    except BrokenPipeError:
+        return 0
+    finally:
+        out.flush()
+        if args.output:
+            out.close()
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
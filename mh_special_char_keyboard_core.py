@@ -0,0 +1,1092 @@
+# -*- coding: utf-8 -*-
+"""
+mh_special_char_keyboard_core.py
+
+GUI-free core of the Special Character Keyboard: the symbol catalogue,
+per-character info, catalogue search and text export. It does not import
+tkinter, so scripts, batch jobs and CI (no display) can use it directly;
+mh_special_char_keyboard_gui.py is a thin Tk layer on top.
+"""
+
+import mmap
+import os
+import sys
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque, namedtuple
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from itertools import islice
+
+from mh_special_char_keyboard_search import NameIndex
+
+# ---------------------------- Symbol data ---------------------------- #
+
+# Core categories with curated symbols. This keeps startup fast and practical.
+# Each category is stored as one string constant; symbols repeated across or
+# within categories are stored once in the SymbolTable built from these.
+_CATALOGUE_SOURCE = (
+    ("Punctuation", "…•—––—―！？¿¡¶§†‡#@&©®™°·•‧¦|‖※‚„‘’‚‛“”„‟‹›«»"),
+    ("Quotes", "'\"‘’‚‛“”„‟‹›«»′″"),
+    ("Currency", "$€£¥₹₽₩₺₴₦₨₫฿₿¢"),
+    ("Math", "±×÷≈≠≤≥∞√∛∜∑∏∫∂∇∩∪∈∉∅∧∨¬⇒⇔≈≅≡∝∴∵‰‱"),
+    ("Arrows", "←↑→↓↔↕⇐⇑⇒⇓⇔↩↪↖↗↘↙⟵⟶⟷⟸⟹⟺"),
+    ("Bullets & Stars", "•◦▪▫●○★☆✦✧✩✪✫✬✭✮✯✰◆◇■□◻◼◉◎"),
+    ("Brackets", "()[]{}〈〉⟨⟩❪❫❬❭❮❯"),
+    ("Letters (Latin Diacritics)", "àáâãäåæçèéêëìíîïñòóôõöøùúûüýÿÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÑÒÓÔÕÖØÙÚÛÜÝÞþßŒœŠšŽžŁłĐđĦħŊŋŦŧ"),
+    ("Greek", "αβγδεζηθικλμνξοπρστυφχψωΑΒΓΔΕΖΗΘΙΚΛΜΝΞΟΠΡΣΤΥΦΧΨΩπΠµΜΩ"),
+    ("Technical", "°µΩ‰℃℉§¶№℗℠™©®♠♣♥♦♭♮♯✓✔✗✘⚠⌘⌥⌃⎋"),
+    ("Box Drawing", "─━│┃┌┏┐┓└┗┘┛├┝┤┥┬┯┴┷┼┿╭╮╯╰╴╵╶╷╲╱╳"),
+)
+
+
+class SymbolTable:
+    """The catalogue with every symbol stored once.
+
+    ``symbols[i]`` is the symbol with id ``i`` (ids follow first appearance in
+    the catalogue). ``members[cat]`` is an ``array("I")`` of the ids shown in
+    category ``cat``, in catalogue order; ``membership[i]`` is a bitset of the
+    categories of symbol ``i``, bit ``n`` standing for ``names[n]``. Repeats
+    within a category are dropped.
+    """
+
+    def __init__(self, source):
+        self.names = tuple(cat for cat, _chars in source)
+        self.ids = {}       # symbol -> id
+        self.symbols = []
+        self.membership = []
+        self.members = {}
+        for bit, (cat, chars) in enumerate(source):
+            ids = array("I")
+            for ch in dict.fromkeys(chars):
+                i = self.ids.get(ch)
+                if i is None:
+                    i = self.ids[ch] = len(self.symbols)
+                    self.symbols.append(ch)
+                    self.membership.append(0)
+                self.membership[i] |= 1 << bit
+                ids.append(i)
+            self.members[cat] = ids
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def id_of(self, ch: str) -> int:
+        """Id of ``ch``, or -1 if it is not in the catalogue."""
+        return self.ids.get(ch, -1)
+
+    def categories_of(self, i: int):
+        """Names of the categories symbol ``i`` belongs to, in catalogue order."""
+        bits = self.membership[i]
+        return [name for n, name in enumerate(self.names) if bits >> n & 1]
+
+    def category(self, cat: str):
+        symbols = self.symbols
+        return [symbols[i] for i in self.members[cat]]
+
+
+# Guards the lazily built module-level tables below, which the metadata
+# service's worker thread may reach at the same time as the GUI.
+_init_lock = threading.RLock()
+_catalogue_source = None
+_pack_errors = []
+_pack_digests = ()
+
+
+def catalogue_source():
+    """Built-in categories followed by those of the user's category packs,
+    as ``(category, symbols)`` pairs; read once (see
+    mh_special_char_keyboard_packs)."""
+    global _catalogue_source, _pack_errors, _pack_digests
+    if _catalogue_source is None:
+        with _init_lock:
+            if _catalogue_source is None:
+                from mh_special_char_keyboard_packs import load_packs
+                packs = load_packs(reserved={cat for cat, _chars in _CATALOGUE_SOURCE})
+                _pack_errors = packs.errors
+                _pack_digests = packs.digests
+                _catalogue_source = _CATALOGUE_SOURCE + packs.categories
+    return _catalogue_source
+
+
+def category_pack_errors():
+    """``"path: reason"`` for each category pack that was skipped."""
+    catalogue_source()
+    return list(_pack_errors)
+
+
+_symbol_table = None
+
+
+def symbol_table() -> SymbolTable:
+    """The SymbolTable of the catalogue, built on first use.
+
+    With category packs in use, it is read straight from the mapped
+    catalogue cache when that is up to date, so startup does not grow with
+    the size of the packs. Otherwise it is built from catalogue_source()
+    (the built-in catalogue alone takes well under a millisecond), leaving
+    the cache to the first catalogue_cache() call (off the GUI thread).
+    """
+    global _symbol_table, _catalogue_cache
+    if _symbol_table is None:
+        with _init_lock:
+            if _symbol_table is None:
+                source = catalogue_source()
+                if not _pack_digests:
+                    cache = None
+                elif _catalogue_cache is False:
+                    cache = open_catalogue_cache()
+                    if cache is not None:
+                        _catalogue_cache = cache
+                else:
+                    cache = _catalogue_cache
+                _symbol_table = SymbolTable(source) if cache is None else _CachedSymbolTable(cache)
+    return _symbol_table
+
+
+class _CodepointSymbols(Sequence):
+    """``symbols`` of a _CachedSymbolTable: characters read from the mapped code points."""
+
+    def __init__(self, codepoints):
+        self._codepoints = codepoints
+
+    def __len__(self):
+        return len(self._codepoints)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [chr(cp) for cp in self._codepoints[i]]
+        return chr(self._codepoints[i])
+
+    def __iter__(self):
+        return map(chr, self._codepoints)
+
+
+class _CachedSymbolTable(SymbolTable):
+    """SymbolTable over the arrays of a CatalogueCache.
+
+    Nothing is copied on creation, so it costs the same for any catalogue
+    size; ``ids`` and ``membership`` are built on first use.
+    """
+
+    def __init__(self, cache):
+        self._cache = cache
+        self.names = tuple(cache.categories)
+        self.symbols = _CodepointSymbols(cache._codepoints)
+        self.members = {cat: cache._members[first:end] for cat, (first, end) in cache.categories.items()}
+        self._ids = None
+        self._membership = None
+
+    @property
+    def ids(self):
+        if self._ids is None:
+            self._ids = {ch: i for i, ch in enumerate(self.symbols)}
+        return self._ids
+
+    @property
+    def membership(self):
+        if self._membership is None:
+            membership = [0] * len(self.symbols)
+            for bit, cat in enumerate(self.names):
+                for i in self.members[cat]:
+                    membership[i] |= 1 << bit
+            self._membership = membership
+        return self._membership
+
+    def id_of(self, ch: str) -> int:
+        return self._cache.find(ch)
+
+    def category(self, cat: str):
+        return self._cache.category(cat)
+
+
+class _Catalogue(Mapping):
+    """Read-only ``category -> [symbols]`` mapping over symbol_table().
+
+    Iterating or taking ``len()`` only touches the category names; each list
+    is built the first time its category is looked up.
+    """
+
+    def __init__(self):
+        self._names = None
+        self._lists = {}
+
+    @property
+    def names(self):
+        if self._names is None:
+            self._names = [cat for cat, _chars in catalogue_source()]
+        return self._names
+
+    def __getitem__(self, cat):
+        items = self._lists.get(cat)
+        if items is None:
+            items = self._lists[cat] = symbol_table().category(cat)
+        return items
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+
+CATEGORIES = _Catalogue()
+
+# ---------------------------- Utilities for symbol info ---------------------------- #
+
+# Resolved once: Windows Alt codes are only offered when running on Windows.
+IS_WINDOWS = sys.platform == "win32"
+
+SYMBOL_INFO_CACHE_SIZE = 4096
+
+
+# collections.namedtuple rather than typing.NamedTuple: importing typing
+# roughly doubles this module's import time.
+SymbolInfo = namedtuple("SymbolInfo", "char name hex dec html_dec html_hex alt")
+
+
+def _symbol_fields(ch: str):
+    """(name, hex, dec, html_dec, html_hex) of ``ch``, computed from unicodedata."""
+    import unicodedata
+    cp = ord(ch)
+    return (unicodedata.name(ch, "<no name>"), f"U+{cp:04X}", str(cp), f"&#{cp};", f"&#x{cp:X};")
+
+
+@lru_cache(maxsize=SYMBOL_INFO_CACHE_SIZE)
+def symbol_info(ch: str) -> SymbolInfo:
+    """Display fields for ``ch``; memoized, see ``symbol_info.cache_info()``.
+
+    Catalogue symbols are read from the on-disk catalogue cache once it has
+    been loaded (see catalogue_cache); until then, and for anything else, the
+    fields are computed. It never waits for the cache, which may be being
+    rebuilt on another thread.
+    """
+    cache = _catalogue_cache or None  # False: not loaded yet
+    i = cache.find(ch) if cache is not None else -1
+    fields = cache.fields(i) if i >= 0 else _symbol_fields(ch)
+    cp = ord(ch)
+    # Windows Alt code works for extended ASCII range using codepage (approx 32..255)
+    alt_hint = f"Alt+{cp}" if 32 <= cp <= 255 and IS_WINDOWS else "—"
+    return SymbolInfo(ch, *fields, alt_hint)
+
+# ---------------------------- Symbol details ---------------------------- #
+
+# The expanded "Details" view of the info panel. Nothing here runs until a
+# field is asked for; symbol_details computes all of them for one symbol.
+
+BIDI_CLASSES = {
+    "L": "Left-to-right", "R": "Right-to-left", "AL": "Arabic letter",
+    "EN": "European number", "ES": "European separator", "ET": "European terminator",
+    "AN": "Arabic number", "CS": "Common separator", "NSM": "Nonspacing mark",
+    "BN": "Boundary neutral", "B": "Paragraph separator", "S": "Segment separator",
+    "WS": "Whitespace", "ON": "Other neutral", "LRE": "Left-to-right embedding",
+    "LRO": "Left-to-right override", "RLE": "Right-to-left embedding",
+    "RLO": "Right-to-left override", "PDF": "Pop directional format",
+    "LRI": "Left-to-right isolate", "RLI": "Right-to-left isolate",
+    "FSI": "First strong isolate", "PDI": "Pop directional isolate",
+}
+
+EAST_ASIAN_WIDTHS = {
+    "F": "Fullwidth", "H": "Halfwidth", "W": "Wide", "Na": "Narrow", "A": "Ambiguous", "N": "Neutral",
+}
+
+
+def _codepoints(text: str) -> str:
+    return " ".join(f"U+{ord(c):04X}" for c in text)
+
+
+def _normal_form(form):
+    def field(ch):
+        import unicodedata
+        text = unicodedata.normalize(form, ch)
+        return f"{text}  ({_codepoints(text)})"
+    return field
+
+
+def _general_category(ch):
+    import unicodedata
+    from mh_special_char_keyboard_unicode import GENERAL_CATEGORIES
+    gc = unicodedata.category(ch)
+    return f"{gc} — {GENERAL_CATEGORIES.get(gc, gc)}"
+
+
+def _bidi_class(ch):
+    import unicodedata
+    bidi = unicodedata.bidirectional(ch)
+    return f"{bidi} — {BIDI_CLASSES.get(bidi, bidi)}" if bidi else "—"
+
+
+def _east_asian_width(ch):
+    import unicodedata
+    eaw = unicodedata.east_asian_width(ch)
+    return f"{eaw} — {EAST_ASIAN_WIDTHS.get(eaw, eaw)}"
+
+
+def _combining_class(ch):
+    import unicodedata
+    return str(unicodedata.combining(ch))
+
+
+def _block(ch):
+    from mh_special_char_keyboard_blocks import block_of
+    return block_of(ord(ch))
+
+
+# (label, ch -> display string), in display order
+DETAIL_FIELDS = (
+    ("NFC", _normal_form("NFC")),
+    ("NFD", _normal_form("NFD")),
+    ("NFKC", _normal_form("NFKC")),
+    ("NFKD", _normal_form("NFKD")),
+    ("UTF-8", lambda ch: ch.encode("utf-8", "surrogatepass").hex(" ").upper()),
+    ("UTF-16", lambda ch: ch.encode("utf-16-be", "surrogatepass").hex(" ", 2).upper()),
+    ("Category", _general_category),
+    ("Bidi class", _bidi_class),
+    ("Combining class", _combining_class),
+    ("East Asian width", _east_asian_width),
+    ("Block", _block),
+)
+
+
+@lru_cache(maxsize=SYMBOL_INFO_CACHE_SIZE)
+def symbol_details(ch: str):
+    """((label, value), ...) for every DETAIL_FIELDS entry of ``ch``; memoized."""
+    return tuple((label, field(ch)) for label, field in DETAIL_FIELDS)
+
+# ---------------------------- Catalogue search ---------------------------- #
+
+_catalogue_index = None
+
+
+def catalogue_index() -> NameIndex:
+    """Name index over symbol_table().symbols; index ids are symbol ids."""
+    global _catalogue_index
+    if _catalogue_index is None:
+        with _init_lock:
+            if _catalogue_index is None:
+                symbols = symbol_table().symbols
+                cache = catalogue_cache()
+                names = None
+                if cache is not None:
+                    names = [cache.fields(i)[0] for i in range(len(symbols))]
+                    names = ["" if name == "<no name>" else name for name in names]
+                _catalogue_index = NameIndex(symbols, names)
+    return _catalogue_index
+
+
+SEARCH_LIMIT = 200
+
+
+def search(query: str, limit: int = SEARCH_LIMIT):
+    """Up to ``limit`` (char, category) pairs matching ``query``, best match first.
+
+    Matching is fuzzy and ranked (see NameIndex.ranked); a symbol listed in
+    several categories is returned once, with its first category.
+    """
+    table = symbol_table()
+    return [(table.symbols[i], table.categories_of(i)[0]) for i in catalogue_index().ranked(query, limit)]
+
+# ---------------------------- Catalogue cache ---------------------------- #
+
+# The symbol table with its precomputed fields, written once to the user
+# cache directory and memory-mapped on later runs; symbol ids are those of
+# SymbolTable. Layout (native byte order):
+# - 8 byte magic ``MHSCKCC1`` and a uint32 header length
+# - a JSON header: format version, Unicode version, catalogue hash, byte
+#   order, symbol and member counts, and ``[category, first, end]`` rows
+# - padding to a multiple of 4 bytes
+# - ``count`` uint32 code points, by symbol id
+# - ``count`` uint32 code points, ascending, then ``count`` uint32 ids in the
+#   same order (for looking up a symbol's id)
+# - ``count + 1`` uint32 offsets into the field blob
+# - ``members`` uint32 symbol ids: every category's symbols in catalogue
+#   order, category ``c`` being ``members[first:end]``
+# - the field blob: per symbol, UTF-8 "name\thex\tdec\thtml_dec\thtml_hex"
+# The file is rebuilt whenever any of the header checks fails.
+
+CATALOGUE_CACHE_FILENAME = "catalogue.bin"
+CATALOGUE_CACHE_FORMAT = 2
+_CACHE_MAGIC = b"MHSCKCC1"
+_U32 = 4
+
+
+def user_cache_dir() -> str:
+    """Per-user cache directory for generated data files (not created here)."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser(r"~\AppData\Local")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "mh_special_char_keyboard")
+
+
+def user_config_dir() -> str:
+    """Per-user folder for settings and history (not created here)."""
+    if sys.platform == "win32":
+        base = os.environ.get("APPDATA") or os.path.expanduser(r"~\AppData\Roaming")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Application Support")
+    else:
+        base = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+    return os.path.join(base, "mh_special_char_keyboard")
+
+
+def _replace_file(path: str, write, mode="wb", encoding=None) -> None:
+    """Call ``write(f)`` on a new temporary file next to ``path``, then make it ``path``.
+
+    The file is flushed, fsynced, given the permissions of the file it
+    replaces and renamed over ``path`` with os.replace, so ``path`` only ever
+    holds the old or the complete new contents. If ``write`` raises (e.g.
+    SaveCancelled), the temporary file is removed and ``path`` is untouched.
+    """
+    folder, name = os.path.split(os.path.abspath(path))
+    tmp = os.path.join(folder, f".~{name}.{os.urandom(4).hex()}.tmp")
+    try:
+        with open(tmp, mode.replace("w", "x"), encoding=encoding) as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(tmp, os.stat(path).st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def write_bytes_atomic(path: str, data: bytes) -> None:
+    """Atomically replace ``path`` with ``data``, creating its folder if needed."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    _replace_file(path, lambda f: f.write(data))
+
+
+def default_catalogue_cache_path() -> str:
+    return os.path.join(user_cache_dir(), CATALOGUE_CACHE_FILENAME)
+
+
+def catalogue_hash(source=None) -> str:
+    """Fingerprint of a catalogue definition; any edit to it changes the hash.
+
+    For the default catalogue_source() only the built-in categories are
+    hashed, together with the digests of the category packs in use, so the
+    cost does not grow with the size of the packs.
+    """
+    import hashlib
+    import json
+    if source is None:
+        catalogue_source()
+        data = json.dumps([_CATALOGUE_SOURCE, _pack_digests], ensure_ascii=False)
+    else:
+        data = json.dumps(source, ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:32]
+
+
+def _cache_header(source):
+    import unicodedata
+    return {
+        "format": CATALOGUE_CACHE_FORMAT,
+        "unidata_version": unicodedata.unidata_version,
+        "catalogue_hash": catalogue_hash(source),
+        "byteorder": sys.byteorder,
+    }
+
+
+def build_catalogue_cache(path=None, source=None) -> str:
+    """Compute every symbol's fields once and write the cache file. Returns the path."""
+    path = path or default_catalogue_cache_path()
+    table = SymbolTable(catalogue_source() if source is None else source)
+    codepoints = array("I", map(ord, table.symbols))
+    by_codepoint = sorted(range(len(codepoints)), key=codepoints.__getitem__)
+    offsets = array("I", [0])
+    blob = bytearray()
+    for ch in table.symbols:
+        blob += "\t".join(_symbol_fields(ch)).encode("utf-8")
+        offsets.append(len(blob))
+    members = array("I")
+    categories = []
+    for cat in table.names:
+        categories.append([cat, len(members), len(members) + len(table.members[cat])])
+        members += array("I", table.members[cat])
+
+    import json
+    header = _cache_header(source)
+    header.update(count=len(codepoints), members=len(members), categories=categories)
+    header = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    header += b" " * (-(len(_CACHE_MAGIC) + _U32 + len(header)) % _U32)
+
+    write_bytes_atomic(path, b"".join((
+        _CACHE_MAGIC,
+        len(header).to_bytes(_U32, "little"),
+        header,
+        codepoints.tobytes(),
+        array("I", (codepoints[i] for i in by_codepoint)).tobytes(),
+        array("I", by_codepoint).tobytes(),
+        offsets.tobytes(),
+        members.tobytes(),
+        blob,
+    )))
+    return path
+
+
+class CatalogueCache:
+    """Read-only, memory-mapped catalogue cache file.
+
+    The code point, offset and member tables are zero-copy views of the map;
+    only the JSON header is parsed on open.
+    """
+
+    def __init__(self, path):
+        import json
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if self._mm[:len(_CACHE_MAGIC)] != _CACHE_MAGIC:
+                raise ValueError(f"Not a catalogue cache file: {path}")
+            start = len(_CACHE_MAGIC) + _U32
+            hlen = int.from_bytes(self._mm[len(_CACHE_MAGIC):start], "little")
+            self.header = json.loads(self._mm[start:start + hlen].decode("utf-8"))
+            self.count = count = self.header["count"]
+            self.categories = {cat: (first, end) for cat, first, end in self.header["categories"]}
+            view = memoryview(self._mm)
+            pos = start + hlen
+            self._codepoints = view[pos:pos + count * _U32].cast("I")
+            pos += count * _U32
+            self._sorted_codepoints = view[pos:pos + count * _U32].cast("I")
+            pos += count * _U32
+            self._sorted_ids = view[pos:pos + count * _U32].cast("I")
+            pos += count * _U32
+            self._offsets = view[pos:pos + (count + 1) * _U32].cast("I")
+            pos += (count + 1) * _U32
+            self._members = view[pos:pos + self.header["members"] * _U32].cast("I")
+            self._blob = pos + self.header["members"] * _U32
+        except (KeyError, TypeError, ValueError):
+            self.close()
+            raise ValueError(f"Corrupt catalogue cache file: {path}") from None
+
+    def close(self):
+        for name in ("_codepoints", "_sorted_codepoints", "_sorted_ids", "_offsets", "_members"):
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+        self._mm.close()
+
+    def __len__(self):
+        return self.count
+
+    def find(self, ch: str) -> int:
+        """Symbol id of ``ch``, or -1 if it is not in the catalogue."""
+        cp = ord(ch)
+        i = bisect_left(self._sorted_codepoints, cp)
+        return self._sorted_ids[i] if i < self.count and self._sorted_codepoints[i] == cp else -1
+
+    def fields(self, i: int):
+        """(name, hex, dec, html_dec, html_hex) of symbol ``i``."""
+        start, end = self._blob + self._offsets[i], self._blob + self._offsets[i + 1]
+        return tuple(self._mm[start:end].decode("utf-8").split("\t"))
+
+    def category(self, cat: str):
+        """Symbols of category ``cat``, in catalogue order."""
+        first, end = self.categories[cat]
+        cps = self._codepoints
+        return [chr(cps[i]) for i in self._members[first:end]]
+
+
+def open_catalogue_cache(path=None, source=None):
+    """Open the catalogue cache if it is readable and was written for this format,
+    Unicode version and catalogue definition; otherwise return None."""
+    path = path or default_catalogue_cache_path()
+    try:
+        cache = CatalogueCache(path)
+    except (OSError, ValueError):
+        return None
+    if all(cache.header.get(k) == v for k, v in _cache_header(source).items()):
+        return cache
+    cache.close()
+    return None
+
+
+def load_catalogue_cache(path=None, source=None):
+    """Open the catalogue cache, (re)building it if it is missing, unreadable, or
+    was written for another format, Unicode version or catalogue definition.
+
+    Returns None if the cache can neither be read nor written (e.g. a read-only
+    home directory); callers then compute symbol fields directly.
+    """
+    cache = open_catalogue_cache(path, source)
+    if cache is None:
+        try:
+            build_catalogue_cache(path, source)
+        except OSError:
+            return None
+        cache = open_catalogue_cache(path, source)
+    return cache
+
+
+_catalogue_cache = False  # not loaded yet
+
+
+def catalogue_cache():
+    """The CatalogueCache for CATEGORIES, loaded (or built) on first call; may be None.
+
+    Building it takes a while for large category packs; the GUI makes the
+    first call from its metadata worker.
+    """
+    global _catalogue_cache
+    if _catalogue_cache is False:
+        with _init_lock:
+            if _catalogue_cache is False:
+                _catalogue_cache = load_catalogue_cache()
+    return _catalogue_cache
+
+# ---------------------------- Metadata service ---------------------------- #
+
+_SKIPPED = object()  # worker marker: the request was cancelled before it ran
+
+
+class MetadataRequest:
+    """Handle of a MetadataService request; ``cancel()`` drops its result."""
+
+    __slots__ = ("key", "fn", "callback", "cancelled")
+
+    def __init__(self, key, fn, callback):
+        self.key = key
+        self.fn = fn
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class MetadataService:
+    """Runs metadata lookups on one worker thread and caches the results.
+
+    ``submit`` is called on the GUI thread; the result is handed back by
+    ``drain``, which the GUI calls from its event loop (``after``), so
+    callbacks always run on the GUI thread. Cached keys call back at once.
+    Submitting on a ``channel`` cancels the channel's previous request,
+    which is what the user has moved past (an older hover or query); the
+    worker skips cancelled requests and ``drain`` drops their results.
+    """
+
+    def __init__(self, cache_size=4096):
+        self.cache_size = cache_size
+        self._cache = OrderedDict()  # key -> result, least recently used first
+        self._channels = {}          # channel -> latest request
+        self._requests = deque()
+        self._results = deque()      # (request, result, error) ready for drain
+        self._outstanding = 0        # submitted and not yet drained
+        self._wakeup = threading.Condition()
+        self._worker = None
+        self._closed = False
+
+    def submit(self, key, fn, callback, channel=None):
+        """Compute ``fn()`` off-thread (unless ``key`` is cached), then ``callback(result)``.
+
+        Returns the MetadataRequest, or None if the callback already ran.
+        """
+        previous = self._channels.pop(channel, None) if channel is not None else None
+        if previous is not None:
+            previous.cancel()
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            callback(self._cache[key])
+            return None
+        request = MetadataRequest(key, fn, callback)
+        if channel is not None:
+            self._channels[channel] = request
+        self._outstanding += 1
+        with self._wakeup:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="metadata", daemon=True)
+                self._worker.start()
+            self._requests.append(request)
+            self._wakeup.notify()
+        return request
+
+    def cancel(self, channel) -> None:
+        """Cancel the latest request on ``channel``, if it is still outstanding."""
+        request = self._channels.pop(channel, None)
+        if request is not None:
+            request.cancel()
+
+    def pending(self) -> bool:
+        """Whether any request is queued, running or waiting to be drained."""
+        return self._outstanding > 0
+
+    def drain(self) -> int:
+        """Deliver finished results on the calling (GUI) thread; returns how many ran."""
+        delivered = 0
+        while self._results:
+            request, result, error = self._results.popleft()
+            self._outstanding -= 1
+            for channel, latest in list(self._channels.items()):
+                if latest is request:
+                    del self._channels[channel]
+            if error is _SKIPPED:
+                continue
+            if error is None:  # cached even if cancelled: the work is done
+                self._cache[request.key] = result
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            if request.cancelled:
+                continue
+            if error is not None:
+                sys.excepthook(type(error), error, error.__traceback__)
+                continue
+            request.callback(result)
+            delivered += 1
+        return delivered
+
+    def close(self):
+        """Stop the worker; queued requests are dropped."""
+        with self._wakeup:
+            self._closed = True
+            self._outstanding -= len(self._requests)
+            self._requests.clear()
+            self._wakeup.notify()
+
+    def _run(self):
+        while True:
+            with self._wakeup:
+                while not self._requests and not self._closed:
+                    self._wakeup.wait()
+                if self._closed:
+                    return
+                request = self._requests.popleft()
+            if request.cancelled:
+                self._results.append((request, None, _SKIPPED))  # lets drain forget it
+                continue
+            try:
+                self._results.append((request, request.fn(), None))
+            except Exception as e:
+                self._results.append((request, None, e))
+
+# ---------------------------- Builder document buffer ---------------------------- #
+
+class TextBuffer:
+    """Append-friendly text held as a list of string chunks (a flat rope).
+
+    Appends only touch the last chunk; ``slice`` finds chunks with bisect, so
+    reading any window costs O(log chunks + window) however long the text is.
+    ``chunks()`` hands the pieces to writers without joining them.
+    """
+
+    CHUNK = 16 * 1024
+
+    def __init__(self, text=""):
+        self._chunks = []
+        self._starts = []  # offset of each chunk
+        self._len = 0
+        self.append(text)
+
+    def __len__(self):
+        return self._len
+
+    def append(self, text: str) -> None:
+        if not text:
+            return
+        if self._chunks and len(self._chunks[-1]) + len(text) <= self.CHUNK:
+            self._chunks[-1] += text
+        else:
+            for i in range(0, len(text), self.CHUNK):
+                self._starts.append(self._len + i)
+                self._chunks.append(text[i:i + self.CHUNK])
+        self._len += len(text)
+
+    def clear(self) -> None:
+        self._chunks = []
+        self._starts = []
+        self._len = 0
+
+    def slice(self, start: int, stop: int) -> str:
+        start = max(0, start)
+        stop = min(self._len, stop)
+        if start >= stop:
+            return ""
+        i = bisect_right(self._starts, start) - 1
+        parts = []
+        while i < len(self._chunks) and self._starts[i] < stop:
+            base = self._starts[i]
+            parts.append(self._chunks[i][max(0, start - base):stop - base])
+            i += 1
+        return "".join(parts)
+
+    def chunks(self):
+        """Snapshot of the chunk list; safe to hand to another thread."""
+        return list(self._chunks)
+
+    def getvalue(self) -> str:
+        return "".join(self._chunks)
+
+# ---------------------------- Export ---------------------------- #
+
+def symbol_record(ch: str) -> dict:
+    """symbol_info(ch) as a plain dict, ready for JSON/CSV writers."""
+    return symbol_info(ch)._asdict()
+
+
+SAVE_CHUNK = 64 * 1024
+
+
+class SaveCancelled(Exception):
+    """Raised by write_atomic when its cancel event is set; the target is untouched."""
+
+
+def _pieces(chunks, size=SAVE_CHUNK):
+    for chunk in chunks:
+        for i in range(0, len(chunk), size):
+            yield chunk[i:i + size]
+
+
+def write_atomic(path: str, chunks, total=None, progress=None, cancel=None) -> None:
+    """Stream ``chunks`` (strings) to ``path`` as UTF-8 without ever leaving a partial file.
+
+    Data goes to a temporary file in the same folder, which is flushed, fsynced
+    and then renamed over ``path`` (see _replace_file). ``progress(done, total)``
+    is called after every piece of at most SAVE_CHUNK characters; if
+    ``cancel`` (a threading.Event) gets set, the temporary file is removed
+    and SaveCancelled is raised. Safe to run on a worker thread.
+    """
+    def write(f):
+        done = 0
+        for piece in _pieces(chunks):
+            if cancel is not None and cancel.is_set():
+                raise SaveCancelled(path)
+            f.write(piece)
+            done += len(piece)
+            if progress is not None:
+                progress(done, total)
+
+    _replace_file(path, write, "w", "utf-8")
+
+
+def save_text(path: str, text) -> None:
+    """Atomically write ``text`` (a string or an iterable of string chunks) as UTF-8."""
+    write_atomic(path, [text] if isinstance(text, str) else text)
+
+# ---------------------------- Export formats ---------------------------- #
+
+# An export format turns text into the output file piece by piece: ``encode``
+# maps one piece (at most SAVE_CHUNK characters) to its encoded form and the
+# output is ``prefix + encode(piece) + ... + suffix``. Encoders work on whole
+# pieces with C-level codecs or str.translate, never per Python character.
+ExportFormat = namedtuple("ExportFormat", "key label extension encode prefix suffix")
+
+EXPORT_FORMATS = {}
+
+
+def register_export_format(fmt: ExportFormat) -> None:
+    EXPORT_FORMATS[fmt.key] = fmt
+
+
+class _EscapeTable(dict):
+    """str.translate table filled in on first sight of each code point."""
+
+    def __init__(self, escape, extra=None):
+        super().__init__({cp: cp for cp in range(128)})
+        self.update(extra or {})
+        self._escape = escape
+
+    def __missing__(self, cp):
+        value = self[cp] = self._escape(cp)
+        return value
+
+
+def _c_escape(cp):
+    # C allows no universal character names below U+00A0: octal escapes of
+    # the UTF-8 bytes instead, matching what \u gives in a UTF-8 literal
+    if cp < 0xA0:
+        return "".join(f"\\{byte:03o}" for byte in chr(cp).encode("utf-8"))
+    return f"\\u{cp:04X}" if cp <= 0xFFFF else f"\\U{cp:08X}"
+
+
+_C_SIMPLE = {ord("\\"): "\\\\", ord('"'): '\\"', ord("\n"): "\\n", ord("\r"): "\\r", ord("\t"): "\\t"}
+_C_SIMPLE.update((cp, _c_escape(cp)) for cp in [*range(0x20), 0x7F] if cp not in _C_SIMPLE)
+# Markup characters are escaped too, so exported text never turns into live HTML.
+_HTML_SPECIAL = {ord("&"): "&amp;", ord("<"): "&lt;", ord(">"): "&gt;", ord('"'): "&quot;"}
+_HTML_HEX_TABLE = _EscapeTable(lambda cp: f"&#x{cp:X};", _HTML_SPECIAL)
+_C_TABLE = _EscapeTable(_c_escape, _C_SIMPLE)
+
+
+def _html_dec_body(piece):
+    if "&" in piece or "<" in piece or ">" in piece or '"' in piece:
+        piece = piece.translate(_HTML_SPECIAL)
+    return piece.encode("ascii", "xmlcharrefreplace").decode("ascii")
+
+
+def _json_body(piece):
+    import json
+    return json.dumps(piece)[1:-1]
+
+
+def _python_body(piece):
+    return piece.encode("unicode_escape").decode("ascii").replace('"', '\\"')
+
+
+for _fmt in (
+    ExportFormat("text", "Plain text (UTF-8)", ".txt", lambda piece: piece, "", ""),
+    ExportFormat("html_dec", "HTML decimal entities (&#8594;)", ".html",
+                 _html_dec_body, "", ""),
+    ExportFormat("html_hex", "HTML hex entities (&#x2192;)", ".html",
+                 lambda piece: piece.translate(_HTML_HEX_TABLE), "", ""),
+    ExportFormat("python", "Python string literal", ".py", _python_body, '"', '"\n'),
+    ExportFormat("js", "JavaScript string literal", ".js", _json_body, '"', '"\n'),
+    ExportFormat("c", "C/C++ string literal (\\u escapes)", ".c", lambda piece: piece.translate(_C_TABLE), '"', '"\n'),
+    ExportFormat("json", "JSON string", ".json", _json_body, '"', '"\n'),
+):
+    register_export_format(_fmt)
+
+
+def export_chunks(chunks, fmt, progress=None):
+    """Yield the encoded output of ``chunks`` in format ``fmt`` (key or ExportFormat).
+
+    ``progress(done, None)`` receives the number of source characters consumed.
+    """
+    if isinstance(fmt, str):
+        fmt = EXPORT_FORMATS[fmt]
+    if fmt.prefix:
+        yield fmt.prefix
+    done = 0
+    for piece in _pieces(chunks):
+        yield fmt.encode(piece)
+        done += len(piece)
+        if progress is not None:
+            progress(done, None)
+    if fmt.suffix:
+        yield fmt.suffix
+
+# ---------------------------- Recent / frequent symbols ---------------------------- #
+
+USAGE_FILENAME = "usage.txt"
+FAVOURITES_FILENAME = "favourites.txt"
+USAGE_CAPACITY = 256
+
+
+class UsageTracker:
+    """Recently and frequently used symbols, with O(1) ``touch``.
+
+    An LRU list of up to ``capacity`` symbols holds the use counts; when it
+    is full the least recently used symbol is dropped, so old favourites
+    age out. Alongside it, one insertion-ordered bucket per count keeps the
+    symbols with that count, most recent last, so frequency ranking needs no
+    sorting of symbols.
+    """
+
+    def __init__(self, capacity=USAGE_CAPACITY, items=()):
+        self.capacity = capacity
+        self._order = OrderedDict()  # symbol -> count, least recently used first
+        self._buckets = {}           # count -> OrderedDict of symbols, least recent first
+        for ch, count in items:
+            self._set(ch, count)
+
+    def __len__(self):
+        return len(self._order)
+
+    def __contains__(self, ch):
+        return ch in self._order
+
+    def count(self, ch: str) -> int:
+        return self._order.get(ch, 0)
+
+    def _set(self, ch, count):
+        if ch in self._order:
+            old = self._order.pop(ch)
+            bucket = self._buckets[old]
+            del bucket[ch]
+            if not bucket:
+                del self._buckets[old]
+        self._order[ch] = count
+        self._buckets.setdefault(count, OrderedDict())[ch] = None
+        if len(self._order) > self.capacity:
+            victim, vcount = self._order.popitem(last=False)
+            bucket = self._buckets[vcount]
+            del bucket[victim]
+            if not bucket:
+                del self._buckets[vcount]
+
+    def touch(self, ch: str) -> None:
+        """Record one use of ``ch``."""
+        self._set(ch, self._order.get(ch, 0) + 1)
+
+    def recent(self, n: int):
+        """Up to ``n`` symbols, most recently used first."""
+        return list(islice(reversed(self._order), n))
+
+    def frequent(self, n: int):
+        """Up to ``n`` symbols, most used first; ties go to the more recent one."""
+        result = []
+        for count in sorted(self._buckets, reverse=True):
+            result.extend(islice(reversed(self._buckets[count]), n - len(result)))
+            if len(result) >= n:
+                break
+        return result
+
+    def snapshot(self):
+        """(symbol, count) pairs, least recently used first; ``UsageTracker(items=...)`` restores them."""
+        return list(self._order.items())
+
+
+def default_usage_path() -> str:
+    return os.path.join(user_config_dir(), USAGE_FILENAME)
+
+
+def load_usage(path=None, capacity=USAGE_CAPACITY) -> UsageTracker:
+    """Tracker restored from the usage file; empty if it is missing or unreadable.
+
+    The file has one ``U+XXXX count`` line per symbol, least recently used first.
+    """
+    items = []
+    try:
+        with open(path or default_usage_path(), encoding="ascii") as f:
+            for line in f:
+                try:
+                    cp, count = line.split()
+                    count = int(count)
+                    if count >= 1:
+                        items.append((chr(int(cp[2:], 16)), count))
+                except ValueError:
+                    continue
+    except (OSError, UnicodeDecodeError):
+        pass
+    return UsageTracker(capacity, items)
+
+
+def save_usage(items, path=None) -> None:
+    """Atomically write ``UsageTracker.snapshot()`` pairs to the usage file."""
+    path = path or default_usage_path()
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    write_atomic(path, [f"U+{ord(ch):04X} {count}\n" for ch, count in items])
+
+
+def default_favourites_path() -> str:
+    return os.path.join(user_config_dir(), FAVOURITES_FILENAME)
+
+
+def load_favourites(path=None):
+    """Favourite symbols in the order they were added; one ``U+XXXX`` line each."""
+    favourites = []
+    try:
+        with open(path or default_favourites_path(), encoding="ascii") as f:
+            for line in f:
+                try:
+                    favourites.append(chr(int(line.strip()[2:], 16)))
+                except ValueError:
+                    continue
+    except (OSError, UnicodeDecodeError):
+        pass
+    return list(dict.fromkeys(favourites))
+
+
+def save_favourites(chars, path=None) -> None:
+    path = path or default_favourites_path()
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    write_atomic(path, [f"U+{ord(ch):04X}\n" for ch in chars])
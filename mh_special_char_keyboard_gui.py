@@ -17,13 +17,38 @@ Tested with Python 3.8+.
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-import unicodedata
+from tkinter import ttk
 import sys
-import platform
+import os
+import time
+import threading
+from functools import partial
+
+# CATEGORIES, SymbolInfo and symbol_info are also re-exported for code that
+# imported them from this module before the core split.
+from mh_special_char_keyboard_core import CATEGORIES as CATEGORIES
+from mh_special_char_keyboard_core import SymbolInfo as SymbolInfo
+from mh_special_char_keyboard_core import symbol_info as symbol_info
+from mh_special_char_keyboard_core import (
+    MetadataService, SaveCancelled, TextBuffer,
+    DETAIL_FIELDS, EXPORT_FORMATS, catalogue_cache, catalogue_index, category_pack_errors, export_chunks,
+    symbol_details, symbol_table, write_atomic,
+    load_favourites, load_usage, save_favourites, save_usage,
+)
 
 APP_TITLE = "Special Character Keyboard"
 FRAME_LABEL = "mh_tools"
+UNICODE_TAB = "All Characters"
+ALL_BLOCKS = "All blocks"
+ALL_CATEGORIES = "All categories"
+SEARCH_DEBOUNCE_MS = 200   # quiet time after the last keystroke before searching
+SEARCH_RESULTS = 200       # best-ranked matches shown for a search
+METADATA_POLL_MS = 15      # how often finished metadata lookups are collected
+LARGE_DOC_CHARS = 200_000  # builder switches to large-document mode above this size
+DOC_VIEW_CHARS = 20_000    # characters rendered into the builder in large-document mode
+DOC_SCROLL_UNIT = 400      # characters per scroll unit in large-document mode
+USAGE_SHOWN = 16           # symbols in each row of the Recent / Frequent panel
+USAGE_SAVE_DELAY_MS = 2000 # quiet time after the last use before the history is saved
 
 # ---------------------------- Helper: window centering ---------------------------- #
 
@@ -35,111 +60,396 @@ def center_window(win: tk.Tk, width: int, height: int) -> None:
 
 # ---------------------------- Tooltip helper ---------------------------- #
 
-class Tooltip:
-    def __init__(self, widget, text_fn, delay=350):
-        self.widget = widget
-        self.text_fn = text_fn  # function returning dynamic text
-        self.delay = delay
-        self.tipwindow = None
-        self.id = None
-        self.widget.bind("<Enter>", self._enter)
-        self.widget.bind("<Leave>", self._leave)
-        self.widget.bind("<Motion>", self._motion)
-
-    def _enter(self, _):
-        self._schedule()
-
-    def _leave(self, _):
-        self._unschedule()
-        self._hide()
-
-    def _motion(self, _):
-        # restart timer to avoid stale display while moving
-        self._unschedule()
-        self._schedule()
+class TooltipManager:
+    """One tooltip per window, shared by every symbol grid.
 
-    def _schedule(self):
-        self._unschedule()
-        self.id = self.widget.after(self.delay, self._show)
+    Grids do their own hit-testing and report the hovered item with
+    ``hover(key, text_fn, anchor_fn)``; the delay restarts only when the key
+    changes. A single Toplevel is created on first use and afterwards just
+    re-texted, moved and withdrawn, never destroyed.
+    """
 
-    def _unschedule(self):
-        if self.id:
-            self.widget.after_cancel(self.id)
-            self.id = None
+    def __init__(self, root, delay=350):
+        self.root = root
+        self.delay = delay
+        self._tip = None
+        self._label = None
+        self._key = None
+        self._after = None
+        self._pending = None  # (text_fn, anchor_fn) of the hovered item
+
+    def hover(self, key, text_fn, anchor_fn):
+        if key == self._key:
+            return
+        self.leave()
+        if key is None:
+            return
+        self._key = key
+        self._pending = (text_fn, anchor_fn)
+        self._after = self.root.after(self.delay, self._show)
+
+    def leave(self):
+        self._key = None
+        self._pending = None
+        if self._after is not None:
+            self.root.after_cancel(self._after)
+            self._after = None
+        if self._tip is not None:
+            self._tip.withdraw()
 
     def _show(self):
-        if self.tipwindow or not self.widget.winfo_viewable():
-            return
-        text = self.text_fn() if callable(self.text_fn) else str(self.text_fn)
+        self._after = None
+        text_fn, anchor_fn = self._pending
+        text = text_fn()
         if not text:
             return
-        x = self.widget.winfo_rootx() + 20
-        y = self.widget.winfo_rooty() + self.widget.winfo_height() + 1
-        self.tipwindow = tw = tk.Toplevel(self.widget)
-        tw.wm_overrideredirect(True)
-        tw.wm_geometry(f"+{x}+{y}")
-        label = tk.Label(tw, text=text, justify=tk.LEFT, relief=tk.SOLID, bd=1,
-                         bg="#ffffe0", fg="#000000", padx=6, pady=4, font=("TkDefaultFont", 9))
-        label.pack(ipadx=1)
-
-    def _hide(self):
-        tw = self.tipwindow
-        self.tipwindow = None
-        if tw:
-            tw.destroy()
-
-# ---------------------------- Symbol data ---------------------------- #
-
-# Core categories with curated symbols. This keeps startup fast and practical.
-CATEGORIES = {
-    "Punctuation": list("…•—––—―！？¿¡¶§†‡#@&©®™°·•‧¦|‖※") + ["‚","„","‘","’","‚","‛","“","”","„","‟","‹","›","«","»"],
-    "Quotes": ["'", '"', "‘", "’", "‚", "‛", "“", "”", "„", "‟", "‹", "›", "«", "»", "′", "″"],
-    "Currency": ["$","€","£","¥","₹","₽","₩","₺","₴","₦","₨","₫","฿","₿","¢"],
-    "Math": ["±","×","÷","≈","≠","≤","≥","∞","√","∛","∜","∑","∏","∫","∂","∇","∩","∪","∈","∉","∅","∧","∨","¬","⇒","⇔","≈","≅","≡","∝","∴","∵","‰","‱"],
-    "Arrows": ["←","↑","→","↓","↔","↕","⇐","⇑","⇒","⇓","⇔","↩","↪","↖","↗","↘","↙","⟵","⟶","⟷","⟸","⟹","⟺"],
-    "Bullets & Stars": ["•","◦","▪","▫","●","○","★","☆","✦","✧","✩","✪","✫","✬","✭","✮","✯","✰","◆","◇","■","□","◻","◼","◉","◎"],
-    "Brackets": ["(", ")", "[", "]", "{", "}", "〈", "〉", "⟨", "⟩", "❪", "❫", "❬", "❭", "❮", "❯"],
-    "Letters (Latin Diacritics)": list("àáâãäåæçèéêëìíîïñòóôõöøùúûüýÿÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÑÒÓÔÕÖØÙÚÛÜÝÞþßŒœŠšŽž") + ["Ł","ł","Đ","đ","Ħ","ħ","Ŋ","ŋ","Ŧ","ŧ"],
-    "Greek": list("αβγδεζηθικλμνξοπρστυφχψωΑΒΓΔΕΖΗΘΙΚΛΜΝΞΟΠΡΣΤΥΦΧΨΩ") + ["π","Π","µ","Μ","Ω"],
-    "Technical": ["°","µ","Ω","‰","℃","℉","§","¶","№","℗","℠","™","©","®","♠","♣","♥","♦","♭","♮","♯","✓","✔","✗","✘","⚠","⌘","⌥","⌃","⎋"],
-    "Box Drawing": ["─","━","│","┃","┌","┏","┐","┓","└","┗","┘","┛","├","┝","┤","┥","┬","┯","┴","┷","┼","┿","╭","╮","╯","╰","╴","╵","╶","╷","╲","╱","╳"],
-}
-
-# ---------------------------- Utilities for symbol info ---------------------------- #
-
-def symbol_info(ch: str) -> dict:
-    cp = ord(ch)
-    hex_cp = f"U+{cp:04X}"
-    dec_cp = str(cp)
-    try:
-        name = unicodedata.name(ch)
-    except ValueError:
-        name = "<no name>"
-    html_dec = f"&#{cp};"
-    html_hex = f"&#x{cp:X};"
-    # Windows Alt code works for extended ASCII range using codepage (approx 32..255)
-    alt_hint = f"Alt+{cp}" if 32 <= cp <= 255 and platform.system() == "Windows" else "—"
-    return {
-        "char": ch,
-        "name": name,
-        "hex": hex_cp,
-        "dec": dec_cp,
-        "html_dec": html_dec,
-        "html_hex": html_hex,
-        "alt": alt_hint,
-    }
+        if self._tip is None:
+            self._tip = tk.Toplevel(self.root)
+            self._tip.wm_overrideredirect(True)
+            self._label = tk.Label(self._tip, justify=tk.LEFT, relief=tk.SOLID, bd=1,
+                                   bg="#ffffe0", fg="#000000", padx=6, pady=4, font=("TkDefaultFont", 9))
+            self._label.pack(ipadx=1)
+        self._label.config(text=text)
+        x, y = anchor_fn()
+        self._tip.wm_geometry(f"+{x}+{y}")
+        self._tip.deiconify()
+        self._tip.lift()
+
+# ---------------------------- Virtualized symbol grid ---------------------------- #
+
+class SymbolGrid(tk.Frame):
+    """Scrollable grid of symbol cells drawn directly on a Canvas.
+
+    Only the rows inside the viewport (plus a few rows of overscan) own canvas
+    items, and those items are recycled while scrolling, so the widget cost is
+    independent of how many symbols ``items`` holds. ``items`` can be any
+    sequence of single-character strings supporting ``len()`` and indexing.
+    Clicks are hit-tested from coordinates and dispatched to the callbacks:
+    click -> on_click(ch), Shift-Click -> on_append(ch),
+    Right-Click -> on_menu(event, ch). Hover tooltips go through the shared
+    ``tooltips`` manager, with text from ``tooltip_fn(ch)``.
+
+    Ctrl-Click toggles a cell in the selection, Ctrl-Shift-Click extends it
+    as a range from the last Ctrl-Clicked cell, and dragging selects the run
+    of cells between press and pointer; a plain click clears it. The
+    selection is a set of item indices; on_select(grid) is called when it
+    changes and Ctrl+C calls on_copy(grid).
+    """
+
+    CELL_W = 64
+    CELL_H = 48
+    GAP = 2
+    OVERSCAN = 2
+    FONT = ("Segoe UI", 18)
+    CELL_BG = "#d9d9d9"
+    CELL_ACTIVE_BG = "#ececec"
+    CELL_SELECTED_BG = "#b9c7d5"
+    CELL_OUTLINE = "#a3a3a3"
+
+    def __init__(self, parent, items=(), on_click=None, on_append=None, on_menu=None,
+                 tooltips=None, tooltip_fn=None, on_select=None, on_copy=None):
+        super().__init__(parent)
+        self.on_click = on_click
+        self.on_append = on_append
+        self.on_menu = on_menu
+        self.on_select = on_select
+        self.on_copy = on_copy
+        self.tooltips = tooltips
+        self.tooltip_fn = tooltip_fn
+
+        self.canvas = tk.Canvas(self, borderwidth=0, highlightthickness=0)
+        vscroll = ttk.Scrollbar(self, orient="vertical", command=self._yview)
+        self.canvas.configure(yscrollcommand=vscroll.set)
+        vscroll.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+
+        self._items = items
+        self._cols = 1
+        self._cells = {}  # item index -> (rect id, text id)
+        self._pool = []   # hidden (rect id, text id) pairs ready for reuse
+        self._hover = None
+        self._pressed = None
+        self._selected = set()  # selected item indices
+        self._anchor = None     # start of Ctrl-Shift-Click ranges
+        self._dragged = False   # the current press turned into a drag selection
+
+        c = self.canvas
+        c.bind("<Configure>", self._on_configure)
+        c.bind("<Button-1>", self._on_press)
+        c.bind("<ButtonRelease-1>", self._on_release)
+        c.bind("<Shift-Button-1>", self._on_shift_press)
+        c.bind("<Control-Button-1>", self._on_ctrl_press)
+        c.bind("<Control-Shift-Button-1>", self._on_ctrl_shift_press)
+        c.bind("<B1-Motion>", self._on_drag)
+        c.bind("<Control-c>", self._on_copy_key)
+        c.bind("<Control-C>", self._on_copy_key)
+        c.bind("<Button-3>", self._on_right_click)
+        c.bind("<MouseWheel>", self._on_wheel)
+        c.bind("<Button-4>", lambda e: self._scroll_units(-3))
+        c.bind("<Button-5>", lambda e: self._scroll_units(3))
+        c.bind("<Motion>", self._on_motion)
+        c.bind("<Leave>", self._on_leave)
+
+    # -- public API --
+
+    @property
+    def items(self):
+        return self._items
+
+    def set_items(self, items):
+        """Show ``items`` from the top, updating the existing cells in place.
+
+        Cells whose symbol is unchanged are left alone, changed ones are
+        re-texted, and canvas items no longer needed are deleted.
+        """
+        old, self._items = self._items, items
+        self._on_leave(None)
+        self._pressed = None
+        self._anchor = None
+        if self._selected:
+            self._set_selection(())
+        self._layout()
+        self.canvas.yview_moveto(0)
+        wanted = self._visible_range()
+        for idx in list(self._cells):
+            if idx not in wanted:
+                self._release(idx)
+            elif items[idx] != old[idx]:
+                self.canvas.itemconfigure(self._cells[idx][1], text=items[idx])
+        self._render()
+        for rect, text in self._pool:
+            self.canvas.delete(rect, text)
+        self._pool.clear()
+
+    def index_at(self, x, y):
+        """Item index under widget coordinates (x, y), or None for gaps/empty space."""
+        cx = self.canvas.canvasx(x)
+        cy = self.canvas.canvasy(y)
+        if cx < 0 or cy < 0:
+            return None
+        col, dx = divmod(int(cx), self.CELL_W)
+        row, dy = divmod(int(cy), self.CELL_H)
+        if col >= self._cols or dx >= self.CELL_W - self.GAP or dy >= self.CELL_H - self.GAP:
+            return None
+        idx = row * self._cols + col
+        return idx if idx < len(self._items) else None
+
+    def selection(self):
+        """Selected symbols, in grid order."""
+        return [self._items[i] for i in sorted(self._selected)]
+
+    def selection_size(self):
+        return len(self._selected)
+
+    def clear_selection(self):
+        self._set_selection(())
+
+    # -- layout & rendering --
+
+    def _layout(self):
+        width = max(self.canvas.winfo_width(), self.CELL_W)
+        self._cols = max(1, width // self.CELL_W)
+        rows = -(-len(self._items) // self._cols)
+        self.canvas.configure(scrollregion=(0, 0, self._cols * self.CELL_W, rows * self.CELL_H))
+
+    def _cell_box(self, idx):
+        row, col = divmod(idx, self._cols)
+        x0 = col * self.CELL_W
+        y0 = row * self.CELL_H
+        return x0, y0, x0 + self.CELL_W - self.GAP, y0 + self.CELL_H - self.GAP
+
+    def _visible_range(self):
+        top = self.canvas.canvasy(0)
+        height = max(self.canvas.winfo_height(), self.CELL_H)
+        first_row = max(0, int(top // self.CELL_H) - self.OVERSCAN)
+        last_row = int((top + height) // self.CELL_H) + self.OVERSCAN
+        start = first_row * self._cols
+        stop = min(len(self._items), (last_row + 1) * self._cols)
+        return range(start, max(start, stop))
+
+    def _release_all(self):
+        for idx in list(self._cells):
+            self._release(idx)
+
+    def _release(self, idx):
+        pair = self._cells.pop(idx)
+        self.canvas.itemconfigure(pair[0], state="hidden")
+        self.canvas.itemconfigure(pair[1], state="hidden")
+        self._pool.append(pair)
+
+    def _render(self):
+        c = self.canvas
+        wanted = self._visible_range()
+        for idx in [i for i in self._cells if i not in wanted]:
+            self._release(idx)
+        for idx in wanted:
+            if idx in self._cells:
+                continue
+            x0, y0, x1, y1 = self._cell_box(idx)
+            fill = self._cell_fill(idx)
+            if self._pool:
+                rect, text = self._pool.pop()
+                c.coords(rect, x0, y0, x1, y1)
+                c.itemconfigure(rect, fill=fill, state="normal")
+                c.coords(text, (x0 + x1) / 2, (y0 + y1) / 2)
+                c.itemconfigure(text, text=self._items[idx], state="normal")
+            else:
+                rect = c.create_rectangle(x0, y0, x1, y1, fill=fill, outline=self.CELL_OUTLINE)
+                text = c.create_text((x0 + x1) / 2, (y0 + y1) / 2, text=self._items[idx], font=self.FONT)
+            self._cells[idx] = (rect, text)
+
+    def _yview(self, *args):
+        self._on_leave(None)  # the cell under the pointer is about to change
+        self.canvas.yview(*args)
+        self._render()
+
+    def _scroll_units(self, units):
+        self._yview("scroll", units, "units")
+
+    def _on_wheel(self, event):
+        if event.delta:
+            # Windows reports multiples of 120, macOS small raw deltas
+            step = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+            self._scroll_units(-step)
+
+    def _on_configure(self, _event):
+        cols = self._cols
+        self._layout()
+        if cols != self._cols:
+            self._release_all()
+        self._render()
+
+    # -- hover & clicks --
+
+    def _cell_fill(self, idx):
+        if idx == self._hover:
+            return self.CELL_ACTIVE_BG
+        return self.CELL_SELECTED_BG if idx in self._selected else self.CELL_BG
+
+    def _set_hover(self, idx):
+        if idx == self._hover:
+            return
+        old, self._hover = self._hover, idx
+        if old in self._cells:
+            self.canvas.itemconfigure(self._cells[old][0], fill=self._cell_fill(old))
+        if idx in self._cells:
+            self.canvas.itemconfigure(self._cells[idx][0], fill=self.CELL_ACTIVE_BG)
+
+    def _set_selection(self, indices):
+        """Replace the selection, repainting only the visible cells that change."""
+        new = set(indices)
+        if new == self._selected:
+            return
+        changed = self._selected ^ new
+        self._selected = new
+        for idx in (changed if len(changed) < len(self._cells) else list(self._cells)):
+            if idx in self._cells:
+                self.canvas.itemconfigure(self._cells[idx][0], fill=self._cell_fill(idx))
+        if self.on_select:
+            self.on_select(self)
+
+    def _on_motion(self, event):
+        idx = self.index_at(event.x, event.y)
+        self._set_hover(idx)
+        if self.tooltips is not None:
+            self.tooltips.hover(None if idx is None else (self, idx), self._hover_text, self._hover_anchor)
+
+    def _on_leave(self, _event):
+        self._set_hover(None)
+        if self.tooltips is not None:
+            self.tooltips.leave()
+
+    def _hover_text(self):
+        if self._hover is None or self.tooltip_fn is None:
+            return ""
+        return self.tooltip_fn(self._items[self._hover])
+
+    def _hover_anchor(self):
+        x0, _y0, _x1, y1 = self._cell_box(self._hover)
+        x = self.canvas.winfo_rootx() + int(x0 - self.canvas.canvasx(0)) + 20
+        y = self.canvas.winfo_rooty() + int(y1 - self.canvas.canvasy(0)) + 1
+        return x, y
+
+    def _on_press(self, event):
+        # no focus_set() here: a plain click must leave the search entry or
+        # builder focused; selecting (Ctrl-click, drag) takes it for Ctrl+C
+        self._pressed = self.index_at(event.x, event.y)
+        self._dragged = False
+
+    def _on_release(self, event):
+        idx, self._pressed = self._pressed, None
+        if self._dragged:
+            self._dragged = False
+            return
+        if idx is not None and idx == self.index_at(event.x, event.y):
+            self._anchor = idx
+            self._set_selection(())
+            if self.on_click:
+                self.on_click(self._items[idx])
+
+    def _on_drag(self, event):
+        idx = self.index_at(event.x, event.y)
+        if self._pressed is None or idx is None or (idx == self._pressed and not self._dragged):
+            return
+        if not self._dragged:
+            self.canvas.focus_set()  # for Ctrl+C
+        self._dragged = True
+        self._anchor = self._pressed
+        lo, hi = sorted((self._pressed, idx))
+        self._set_selection(range(lo, hi + 1))
+
+    def _on_ctrl_press(self, event):
+        self.canvas.focus_set()
+        self._pressed = None
+        idx = self.index_at(event.x, event.y)
+        if idx is not None:
+            self._anchor = idx
+            self._set_selection(self._selected ^ {idx})
+
+    def _on_ctrl_shift_press(self, event):
+        self.canvas.focus_set()
+        self._pressed = None
+        idx = self.index_at(event.x, event.y)
+        if idx is not None:
+            anchor = idx if self._anchor is None else self._anchor
+            lo, hi = sorted((anchor, idx))
+            self._set_selection(self._selected.union(range(lo, hi + 1)))
+
+    def _on_copy_key(self, _event):
+        if self._selected and self.on_copy:
+            self.on_copy(self)
+        return "break"
+
+    def _on_shift_press(self, event):
+        self._pressed = None
+        idx = self.index_at(event.x, event.y)
+        if idx is not None and self.on_append:
+            self.on_append(self._items[idx])
+
+    def _on_right_click(self, event):
+        idx = self.index_at(event.x, event.y)
+        if idx is not None and self.on_menu:
+            self.on_menu(event, self._items[idx])
 
 # ---------------------------- Main Application ---------------------------- #
 
 class SpecialCharKeyboard(tk.Tk):
     def __init__(self):
+        self._startup_t0 = time.perf_counter()
+        self.startup_seconds = None
+        self.startup_phases = []  # (phase, seconds since __init__ started), see _mark
         super().__init__()
+        self._mark("tk_root")
         self.title(APP_TITLE)
         self.configure(bg="#ececec")  # default light grey background
         center_window(self, 1280, 820)
+        self._mark("center_window")
 
         self._builder_var = tk.StringVar(value="")
+        self.tooltips = TooltipManager(self)
         self._last_symbol = None
+        self._append_queue = []
+        self._append_flush = None
 
         outer = ttk.LabelFrame(self, text=FRAME_LABEL)
         outer.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -151,6 +461,8 @@ class SpecialCharKeyboard(tk.Tk):
         self.search_var = tk.StringVar()
         search_entry = tk.Entry(top_bar, textvariable=self.search_var, width=32)
         search_entry.pack(side=tk.LEFT, padx=6)
+        search_entry.bind("<Return>", self._do_search)
+        self.search_var.trace_add("write", self._on_search_typed)
         tk.Button(top_bar, text="Find", bg="#d9d9d9", command=self._do_search).pack(side=tk.LEFT)
         tk.Button(top_bar, text="Clear", bg="#d9d9d9", command=self._clear_search).pack(side=tk.LEFT, padx=(6,0))
 
@@ -162,19 +474,36 @@ class SpecialCharKeyboard(tk.Tk):
         right = tk.Frame(main)
         main.add(left, stretch="always")
         main.add(right, minsize=360)
+        self._mark("layout")
 
         # Tabs with categories
         self.tabs = ttk.Notebook(left)
         self.tabs.pack(fill=tk.BOTH, expand=True)
 
+        # Each tab starts as an empty placeholder; its contents are built by
+        # the registered builder the first time the tab is selected
+        # (see _on_tab_changed).
         self.category_frames = {}
-        for cat, items in CATEGORIES.items():
-            frame = self._make_scrollable_category(self.tabs, cat, items)
-            self.tabs.add(frame, text=cat)
+        self._pending_tabs = {}
+        for cat in CATEGORIES:
+            frame = self._add_lazy_tab(cat, lambda parent, c=cat: self._build_category_tab(parent, c))
             self.category_frames[cat] = frame
-
-        # Search tab (lazy created)
+        self._add_lazy_tab(UNICODE_TAB, self._build_unicode_browser)
+        self._unicode_index = None
+        self.tabs.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._on_tab_changed()
+        self._mark("tabs")
+
+        # Symbol info and search lookups run on the metadata service's worker
+        # thread; results come back through _drain_metadata on the event loop.
+        self._metadata = MetadataService()
+        self._metadata_poll = None
+
+        # Search tab (created on first search, then reused); the name index
+        # is built by the first search, on the worker thread
         self.search_tab = None
+        self._search_grid = None
+        self._search_after = None   # pending debounce timer
 
         # Right side: info + builder
         info_frame = ttk.LabelFrame(right, text="Symbol Info")
@@ -208,56 +537,231 @@ class SpecialCharKeyboard(tk.Tk):
         btn_row.grid(row=1, column=1, sticky="w", padx=4, pady=(0,6))
         tk.Button(btn_row, text="Copy Symbol", bg="#d9d9d9", command=self._copy_current).pack(side=tk.LEFT)
         tk.Button(btn_row, text="Append to Builder", bg="#d9d9d9", command=self._append_current).pack(side=tk.LEFT, padx=6)
+        self._details_btn = tk.Button(btn_row, text="Details ▸", bg="#d9d9d9", command=self._toggle_details)
+        self._details_btn.pack(side=tk.LEFT)
+
+        # Details (normalization forms, encodings, properties): the rows are
+        # built on first expand and only computed while expanded.
+        self._info_frame = info_frame
+        self._details_frame = None
+        self._detail_vars = []
+        self._info_symbol = None
+        self._mark("info_panel")
+
+        # Recent / Frequent panel: every click or append is counted in
+        # self._usage (O(1)); the rows are refreshed on idle and the history
+        # is written on a worker thread a little later (see _note_usage).
+        usage_frame = ttk.LabelFrame(right, text="Recent / Frequent / Favourites")
+        usage_frame.pack(fill=tk.X, padx=8, pady=4)
+        usage_frame.columnconfigure(1, weight=1)
+        self._usage = load_usage()
+        self._favourites = dict.fromkeys(load_favourites())  # ordered set
+        self._usage_refresh = None  # pending idle refresh of the rows
+        self._usage_save = None     # pending save timer
+        self._usage_saver = None    # thread of the save in flight, if any
+        self._recent_grid = self._add_usage_row(usage_frame, 0, "Recent")
+        self._frequent_grid = self._add_usage_row(usage_frame, 1, "Frequent")
+        self._favourites_grid = self._add_usage_row(usage_frame, 2, "Favourites")
+        self._refresh_usage()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # Symbol context menu: one per window, built on the first right-click
+        # and retargeted on every popup (see _context_menu).
+        self._menu = None
+        self._menu_target = None
+        self._menu_favourite = None  # index of the Add/Remove Favourites entry
+        self._menu_selection = None  # index of the Copy Selection As cascade
+        self._menu_grid = None       # SymbolGrid the menu was opened on
+        self._mark("usage_panel")
 
         builder = ttk.LabelFrame(right, text="Builder (use Shift‑Click on symbols to append)")
         builder.pack(fill=tk.BOTH, expand=True, padx=8, pady=(4, 8))
 
-        self.builder_text = tk.Text(builder, height=10, wrap=tk.WORD)
-        self.builder_text.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
+        text_row = tk.Frame(builder)
+        text_row.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
+        self.builder_text = tk.Text(text_row, height=10, wrap=tk.WORD)
+        self.builder_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        # Large-document mode: the text lives in self._doc (a TextBuffer) and
+        # only a DOC_VIEW_CHARS window of it is rendered into builder_text.
+        self._doc = None
+        self._doc_view = 0  # offset of the rendered window
+        self._doc_scrollbar = ttk.Scrollbar(text_row, orient="vertical", command=self._doc_scroll)
+        self.large_doc_var = tk.BooleanVar(value=False)
 
         bbar = tk.Frame(builder)
         bbar.pack(fill=tk.X, padx=8, pady=(0,8))
         tk.Button(bbar, text="Copy All", bg="#d9d9d9", command=self._copy_all).pack(side=tk.LEFT)
         tk.Button(bbar, text="Clear", bg="#d9d9d9", command=self._clear_builder).pack(side=tk.LEFT, padx=6)
         tk.Button(bbar, text="Save to .txt", bg="#d9d9d9", command=self._save_to_txt).pack(side=tk.LEFT, padx=(6,0))
+        self._export_formats = {fmt.label: fmt for fmt in EXPORT_FORMATS.values()}
+        self.export_var = tk.StringVar(value=EXPORT_FORMATS["html_dec"].label)
+        tk.Button(bbar, text="Export…", bg="#d9d9d9", command=self._export).pack(side=tk.LEFT, padx=(6,0))
+        ttk.Combobox(bbar, textvariable=self.export_var, state="readonly", width=30,
+                     values=list(self._export_formats)).pack(side=tk.LEFT, padx=(4,0))
+        self._cancel_save_btn = tk.Button(bbar, text="Cancel Save", bg="#d9d9d9", state=tk.DISABLED,
+                                          command=self._cancel_save)
+        self._cancel_save_btn.pack(side=tk.LEFT, padx=(6,0))
+        self._save_cancel = None  # threading.Event of the save in progress, if any
+        self._save_worker = None
+        self._close_after_save = False
+        tk.Checkbutton(bbar, text="Large document mode", variable=self.large_doc_var,
+                       command=self._on_large_doc_toggled).pack(side=tk.RIGHT)
 
         # Status bar
         self.status = tk.StringVar(value="Ready. Click a symbol to copy. Shift‑Click to append.")
         sbar = tk.Label(self, textvariable=self.status, anchor="w", bg="#e0e0e0")
         sbar.pack(fill=tk.X, side=tk.BOTTOM)
+        self._mark("builder")
+
+        self.after_idle(self._record_startup_time)
+
+    def _mark(self, phase):
+        """Startup instrumentation point; read back from startup_phases."""
+        self.startup_phases.append((phase, time.perf_counter() - self._startup_t0))
+
+    def _report_pack_errors(self):
+        errors = category_pack_errors()
+        for error in errors:
+            print(f"Skipped category pack {error}", file=sys.stderr)
+        if errors:
+            self.status.set(f"Skipped {len(errors)} invalid category pack{'s' if len(errors) != 1 else ''}: "
+                            f"{errors[0]}")
+
+    def _record_startup_time(self):
+        self._mark("first_idle")
+        self.startup_seconds = self.startup_phases[-1][1]
+        # map (or rebuild, after a catalogue or pack change) the catalogue cache
+        # on the metadata worker now, before the first hover or search needs it
+        self._request_metadata("catalogue_cache", catalogue_cache, lambda _cache: None)
+        self._report_pack_errors()
+        if os.environ.get("MH_SCK_TIMING"):
+            prev = 0.0
+            for phase, t in self.startup_phases:
+                print(f"  {phase:<14} {(t - prev) * 1000:7.1f} ms", file=sys.stderr)
+                prev = t
+            print(f"startup: {self.startup_seconds * 1000:.1f} ms", file=sys.stderr)
+            self.bind("<Destroy>", self._report_cache_stats, add="+")
+
+    def _report_cache_stats(self, event):
+        if event.widget is self:
+            print(f"symbol_info cache: {symbol_info.cache_info()}", file=sys.stderr)
 
     # ---------------------------- Category grid builder ---------------------------- #
 
     def _make_scrollable_category(self, parent, cat_name, items):
-        container = tk.Frame(parent)
-        canvas = tk.Canvas(container, borderwidth=0, highlightthickness=0)
-        inner = tk.Frame(canvas)
-        vscroll = ttk.Scrollbar(container, orient="vertical", command=canvas.yview)
-        canvas.configure(yscrollcommand=vscroll.set)
-
-        vscroll.pack(side="right", fill="y")
-        canvas.pack(side="left", fill="both", expand=True)
-        canvas.create_window((0, 0), window=inner, anchor="nw")
-
-        def on_config(event):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-        inner.bind("<Configure>", on_config)
-
-        # Build grid of symbol buttons
-        COLS = 14
-        for idx, ch in enumerate(items):
-            btn = tk.Button(inner, text=ch, width=4, height=1, bg="#d9d9d9", font=("Segoe UI", 18),
-                            command=lambda c=ch: self._on_symbol_click(c))
-            r, c = divmod(idx, COLS)
-            btn.grid(row=r, column=c, padx=2, pady=2, sticky="nsew")
-            btn.bind("<Shift-Button-1>", lambda e, c=ch: self._append_symbol(c))
-            btn.bind("<Button-3>", lambda e, c=ch: self._context_menu(e, c))
-            Tooltip(btn, lambda c=ch: self._tooltip_text(c))
-
-        # make columns expand evenly
-        for c in range(COLS):
-            inner.grid_columnconfigure(c, weight=1)
-        return container
+        return SymbolGrid(parent, items,
+                          on_click=self._on_symbol_click,
+                          on_append=self._append_symbol,
+                          on_menu=self._context_menu,
+                          tooltips=self.tooltips,
+                          tooltip_fn=self._tooltip_text,
+                          on_select=self._on_grid_select,
+                          on_copy=self._copy_selection)
+
+    def _add_lazy_tab(self, text, builder):
+        frame = tk.Frame(self.tabs)
+        self.tabs.add(frame, text=text)
+        self._pending_tabs[str(frame)] = builder
+        return frame
+
+    def _on_tab_changed(self, _event=None):
+        current = self.tabs.select()
+        builder = self._pending_tabs.pop(current, None)
+        if builder is not None:
+            builder(self.nametowidget(current))
+
+    def _build_category_tab(self, parent, cat):
+        grid = self._make_scrollable_category(parent, cat, CATEGORIES[cat])
+        grid.pack(fill=tk.BOTH, expand=True)
+
+    # ---------------------------- All Characters browser ---------------------------- #
+
+    def _build_unicode_browser(self, parent):
+        import mh_special_char_keyboard_unicode as unicode_index
+        self._unicode_index = unicode_index.load_index()
+        if self._unicode_index is None:
+            self._show_index_missing(parent)
+        else:
+            self._show_unicode_browser(parent)
+
+    def _show_index_missing(self, parent):
+        box = tk.Frame(parent)
+        box.pack(expand=True)
+        tk.Label(box, text="The Unicode character index has not been built yet.\n"
+                           "Building it takes a few seconds; it is stored in your user cache folder.").pack(pady=(0, 8))
+        btn = tk.Button(box, text="Build Index", bg="#d9d9d9")
+        btn.config(command=lambda: self._start_index_build(parent, box, btn))
+        btn.pack()
+
+    def _start_index_build(self, parent, box, btn):
+        import mh_special_char_keyboard_unicode as unicode_index
+        from tkinter import messagebox
+        btn.config(state=tk.DISABLED)
+        self.status.set("Building Unicode index…")
+        result = {}
+
+        def work():
+            try:
+                result["path"] = unicode_index.build_index()
+            except Exception as e:
+                result["error"] = e
+
+        # not a daemon: the interpreter must not kill a save half-way through
+        worker = self._save_worker = threading.Thread(target=work)
+        worker.start()
+
+        def poll():
+            if worker.is_alive():
+                self.after(100, poll)
+                return
+            index = unicode_index.load_index(result["path"]) if "path" in result else None
+            if index is None:
+                btn.config(state=tk.NORMAL)
+                messagebox.showerror("Index Error", f"Could not build the Unicode index:\n{result.get('error')}")
+                self.status.set("Unicode index build failed.")
+                return
+            box.destroy()
+            self._unicode_index = index
+            self._show_unicode_browser(parent)
+            self.status.set(f"Unicode index built: {len(index)} characters.")
+        poll()
+
+    def _show_unicode_browser(self, parent):
+        import mh_special_char_keyboard_unicode as unicode_index
+        index = self._unicode_index
+        bar = tk.Frame(parent)
+        bar.pack(fill=tk.X, pady=(4, 4))
+
+        tk.Label(bar, text="Block:").pack(side=tk.LEFT)
+        block_var = tk.StringVar(value=ALL_BLOCKS)
+        block_box = ttk.Combobox(bar, textvariable=block_var, state="readonly", width=34,
+                                 values=[ALL_BLOCKS] + [name for name, _first, _end in index.blocks])
+        block_box.pack(side=tk.LEFT, padx=6)
+
+        tk.Label(bar, text="Category:").pack(side=tk.LEFT)
+        categories = {f"{gc} — {unicode_index.GENERAL_CATEGORIES.get(gc, gc)}": gc for gc in sorted(index.categories)}
+        cat_var = tk.StringVar(value=ALL_CATEGORIES)
+        cat_box = ttk.Combobox(bar, textvariable=cat_var, state="readonly", width=30,
+                               values=[ALL_CATEGORIES] + list(categories))
+        cat_box.pack(side=tk.LEFT, padx=6)
+
+        count_var = tk.StringVar()
+        tk.Label(bar, textvariable=count_var).pack(side=tk.LEFT, padx=6)
+
+        grid = self._make_scrollable_category(parent, UNICODE_TAB, index)
+        grid.pack(fill=tk.BOTH, expand=True)
+
+        def apply_filter(_event=None):
+            block = block_var.get()
+            view = index.view(block=None if block == ALL_BLOCKS else block,
+                              category=categories.get(cat_var.get()))
+            grid.set_items(view)
+            count_var.set(f"{len(view)} characters")
+
+        block_box.bind("<<ComboboxSelected>>", apply_filter)
+        cat_box.bind("<<ComboboxSelected>>", apply_filter)
+        apply_filter()
 
     # ---------------------------- Actions ---------------------------- #
 
@@ -265,111 +769,512 @@ class SpecialCharKeyboard(tk.Tk):
         self.clipboard_clear()
         self.clipboard_append(ch)
         self._last_symbol = ch
+        self._note_usage(ch)
         self._update_info(ch)
         self.status.set(f"Copied: '{ch}' to clipboard.")
 
     def _append_symbol(self, ch: str):
-        self.builder_text.insert(tk.END, ch)
+        # Queued: a burst of appends becomes one insert and one info/status
+        # refresh on the next idle cycle (see _flush_appends).
+        self._append_queue.append(ch)
         self._last_symbol = ch
+        self._note_usage(ch)
+        if self._append_flush is None:
+            self._append_flush = self.after_idle(self._flush_appends)
+
+    def _flush_appends(self):
+        """Insert queued appends now, in order; called on idle and before any builder read."""
+        if self._append_flush is not None:
+            self.after_cancel(self._append_flush)
+            self._append_flush = None
+        if not self._append_queue:
+            return
+        text = "".join(self._append_queue)
+        count = len(self._append_queue)
+        self._append_queue.clear()
+        if self._doc is not None:
+            self._doc_append(text)
+        else:
+            self.builder_text.insert(tk.END, text)
+            # switch on only when this append crosses the threshold, so that
+            # unchecking the mode sticks for a builder that is already large
+            size = self._builder_chars()
+            if size > LARGE_DOC_CHARS >= size - len(text):
+                self.large_doc_var.set(True)
+                self._enter_large_doc()
+        ch = text[-1]
         self._update_info(ch)
-        self.status.set(f"Appended: '{ch}' to builder.")
+        if count == 1:
+            self.status.set(f"Appended: '{ch}' to builder.")
+        else:
+            self.status.set(f"Appended {count} symbols to builder (last: '{ch}').")
+
+    # ---------------------------- Recent / Frequent ---------------------------- #
+
+    def _add_usage_row(self, parent, row, label):
+        tk.Label(parent, text=label + ":").grid(row=row, column=0, sticky="ne", padx=4, pady=2)
+        grid = self._make_scrollable_category(parent, label, [])
+        grid.canvas.configure(height=SymbolGrid.CELL_H)
+        grid.grid(row=row, column=1, sticky="ew", padx=(0, 4), pady=2)
+        return grid
+
+    def _note_usage(self, ch: str):
+        self._usage.touch(ch)
+        self._usage_changed()
+
+    def _usage_changed(self):
+        if self._usage_refresh is None:
+            self._usage_refresh = self.after_idle(self._refresh_usage)
+        if self._usage_save is None:
+            self._usage_save = self.after(USAGE_SAVE_DELAY_MS, self._save_usage)
+
+    def _refresh_usage(self):
+        self._usage_refresh = None
+        self._recent_grid.set_items(self._usage.recent(USAGE_SHOWN))
+        self._frequent_grid.set_items(self._usage.frequent(USAGE_SHOWN))
+        self._favourites_grid.set_items(list(self._favourites))
+
+    def _toggle_favourite(self, ch: str):
+        if ch in self._favourites:
+            del self._favourites[ch]
+            self.status.set(f"Removed '{ch}' from favourites.")
+        else:
+            self._favourites[ch] = None
+            self.status.set(f"Added '{ch}' to favourites.")
+        self._usage_changed()
+
+    def _save_usage(self):
+        """Write the usage history on a worker thread; one save at a time."""
+        self._usage_save = None
+        if self._usage_saver is not None and self._usage_saver.is_alive():
+            self._usage_save = self.after(USAGE_SAVE_DELAY_MS, self._save_usage)
+            return
+        self._usage_saver = threading.Thread(target=self._write_usage, daemon=True,
+                                             args=(self._usage.snapshot(), list(self._favourites)))
+        self._usage_saver.start()
+
+    @staticmethod
+    def _write_usage(items, favourites):
+        try:
+            save_usage(items)
+            save_favourites(favourites)
+        except OSError:
+            pass  # history is best effort; the next save tries again
+
+    def _on_close(self):
+        from tkinter import messagebox
+        if self._save_cancel is not None and not self._close_after_save:
+            answer = messagebox.askyesnocancel(
+                "Save in Progress",
+                "A save is still running.\n\nYes: close when it has finished.\n"
+                "No: cancel the save and close now.\nCancel: keep the window open.")
+            if answer is None:
+                return
+            if answer:
+                self._close_after_save = True  # poll() in _start_save closes the window
+                self.status.set("Closing when the save has finished…")
+                return
+            self._save_cancel.set()
+            self._save_worker.join()  # cancel is checked per chunk; removes the temp file
+        # flush a pending history save before the window goes away
+        if self._usage_save is not None:
+            self.after_cancel(self._usage_save)
+            self._usage_save = None
+            if self._usage_saver is not None:
+                self._usage_saver.join()
+            self._write_usage(self._usage.snapshot(), list(self._favourites))
+        self._metadata.close()
+        self.destroy()
+
+    # ---------------------------- Metadata service ---------------------------- #
+
+    def _request_metadata(self, key, fn, callback, channel=None):
+        """Look ``key`` up on the metadata worker; ``callback(result)`` runs on the event loop."""
+        self._metadata.submit(key, fn, callback, channel)
+        if self._metadata.pending() and self._metadata_poll is None:
+            self._metadata_poll = self.after(METADATA_POLL_MS, self._drain_metadata)
+
+    def _drain_metadata(self):
+        self._metadata_poll = None
+        self._metadata.drain()
+        if self._metadata.pending():
+            self._metadata_poll = self.after(METADATA_POLL_MS, self._drain_metadata)
+
+    # ---------------------------- Context menu ---------------------------- #
+
+    def _symbol_menu(self):
+        """The window's symbol context menu, built on first use."""
+        if self._menu is None:
+            self._menu = tk.Menu(self, tearoff=0)
+            self._menu.add_command(state=tk.DISABLED)  # header: symbol and code point
+            self._menu.add_separator()
+            self.add_menu_action("Copy", self._on_symbol_click)
+            self.add_menu_action("Append to Builder", self._append_symbol)
+            self._menu.add_separator()
+            self.add_menu_action("Copy HTML Entity (&#…;)", lambda ch: self._copy_field(ch, "html_dec"))
+            self.add_menu_action("Copy HTML Entity (&#x…;)", lambda ch: self._copy_field(ch, "html_hex"))
+            self.add_menu_action("Copy Code Point (U+…)", lambda ch: self._copy_field(ch, "hex"))
+            formats = tk.Menu(self._menu, tearoff=0)
+            for fmt in EXPORT_FORMATS.values():
+                formats.add_command(label=fmt.label,
+                                    command=lambda key=fmt.key: self._copy_selection(self._menu_grid, key))
+            self._menu.add_cascade(label="Copy Selection As", menu=formats)
+            self._menu_selection = self._menu.index(tk.END)
+            self._menu.add_separator()
+            self._menu_favourite = self.add_menu_action("Add to Favourites", self._toggle_favourite)
+        return self._menu
+
+    def add_menu_action(self, label, command):
+        """Add an entry to the symbol context menu; ``command(ch)`` receives the
+        right-clicked symbol. Returns the entry's index."""
+        menu = self._symbol_menu()
+        menu.add_command(label=label, command=lambda: command(self._menu_target))
+        return menu.index(tk.END)
 
     def _context_menu(self, event, ch: str):
-        menu = tk.Menu(self, tearoff=0)
-        menu.add_command(label="Copy", command=lambda: self._on_symbol_click(ch))
-        menu.add_command(label="Append to Builder", command=lambda: self._append_symbol(ch))
-        menu.tk_popup(event.x_root, event.y_root)
+        menu = self._symbol_menu()
+        self._menu_target = ch
+        menu.entryconfigure(0, label=f"{ch}   {symbol_info(ch).hex}")
+        menu.entryconfigure(self._menu_favourite, label="Remove from Favourites"
+                            if ch in self._favourites else "Add to Favourites")
+        grid = getattr(event, "widget", None)
+        self._menu_grid = grid = grid.master if isinstance(getattr(grid, "master", None), SymbolGrid) else None
+        selected = grid.selection_size() if grid is not None else 0
+        menu.entryconfigure(self._menu_selection, label=f"Copy Selection As ({selected})",
+                            state=tk.NORMAL if selected else tk.DISABLED)
+        try:
+            menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            menu.grab_release()
+
+    def _on_grid_select(self, grid):
+        count = grid.selection_size()
+        if count:
+            self.status.set(f"{count} symbol{'s' if count != 1 else ''} selected. "
+                            "Ctrl+C copies them; right-click for other formats.")
+
+    def _copy_selection(self, grid, fmt="text"):
+        """Copy the grid's selection in export format ``fmt`` with one clipboard write."""
+        chars = grid.selection() if grid is not None else []
+        if not chars:
+            return
+        fmt = EXPORT_FORMATS[fmt]
+        payload = "".join(export_chunks(["".join(chars)], fmt)).rstrip("\n")
+        self.clipboard_clear()
+        self.clipboard_append(payload)
+        self.status.set(f"Copied {len(chars)} symbols as {fmt.label}.")
+
+    def _copy_field(self, ch: str, field: str):
+        text = getattr(symbol_info(ch), field)
+        self.clipboard_clear()
+        self.clipboard_append(text)
+        self.status.set(f"Copied: '{text}' to clipboard.")
 
     def _tooltip_text(self, ch: str) -> str:
         info = symbol_info(ch)
-        return f"{ch}  \n{info['name']}\n{info['hex']} (dec {info['dec']})\nHTML: {info['html_dec']}  {info['html_hex']}\nKeyboard: {info['alt']}"
+        return f"{ch}  \n{info.name}\n{info.hex} (dec {info.dec})\nHTML: {info.html_dec}  {info.html_hex}\nKeyboard: {info.alt}"
 
     def _update_info(self, ch: str):
-        info = symbol_info(ch)
+        self._info_symbol = ch
         self.char_big.config(text=ch)
-        self.name_var.set(info["name"])
-        self.hex_var.set(info["hex"])
-        self.dec_var.set(info["dec"])
-        self.html_dec_var.set(info["html_dec"])
-        self.html_hex_var.set(info["html_hex"])
-        self.alt_var.set(info["alt"])
+        self._request_metadata(("info", ch), partial(symbol_info, ch), self._show_info, channel="info")
+        if self._details_shown():
+            self._request_details(ch)
+
+    def _show_info(self, info: SymbolInfo):
+        self.name_var.set(info.name)
+        self.hex_var.set(info.hex)
+        self.dec_var.set(info.dec)
+        self.html_dec_var.set(info.html_dec)
+        self.html_hex_var.set(info.html_hex)
+        self.alt_var.set(info.alt)
+
+    def _details_shown(self):
+        return self._details_frame is not None and self._details_frame.winfo_manager() == "grid"
+
+    def _toggle_details(self):
+        if self._details_shown():
+            self._details_frame.grid_remove()
+            self._details_btn.config(text="Details ▸")
+            self._metadata.cancel("details")
+            return
+        if self._details_frame is None:
+            frame = self._details_frame = tk.Frame(self._info_frame)
+            for r, (label, _field) in enumerate(DETAIL_FIELDS):
+                var = tk.StringVar()
+                tk.Label(frame, text=label + ":").grid(row=r, column=0, sticky="e", padx=4, pady=1)
+                tk.Entry(frame, textvariable=var, width=44).grid(row=r, column=1, sticky="w", padx=4, pady=1)
+                self._detail_vars.append(var)
+        self._details_frame.grid(row=2, column=0, columnspan=2, sticky="w", padx=8, pady=(0, 6))
+        self._details_btn.config(text="Details ▾")
+        if self._info_symbol is not None:
+            self._request_details(self._info_symbol)
+
+    def _request_details(self, ch: str):
+        for var in self._detail_vars:
+            var.set("…")
+        self._request_metadata(("details", ch), partial(symbol_details, ch), self._show_details, channel="details")
+
+    def _show_details(self, details):
+        for var, (_label, value) in zip(self._detail_vars, details):
+            var.set(value)
 
     def _copy_current(self):
+        from tkinter import messagebox
         if not self._last_symbol:
             messagebox.showinfo("Nothing Selected", "Click a symbol first.")
             return
         self._on_symbol_click(self._last_symbol)
 
     def _append_current(self):
+        from tkinter import messagebox
         if not self._last_symbol:
             messagebox.showinfo("Nothing Selected", "Click a symbol first.")
             return
         self._append_symbol(self._last_symbol)
 
     def _copy_all(self):
-        text = self.builder_text.get("1.0", tk.END).rstrip("\n")
+        self._flush_appends()
+        if self._doc is not None:
+            text = self._doc.getvalue()
+        else:
+            text = self.builder_text.get("1.0", tk.END).rstrip("\n")
         self.clipboard_clear()
         self.clipboard_append(text)
         self.status.set("Builder contents copied to clipboard.")
 
     def _clear_builder(self):
-        self.builder_text.delete("1.0", tk.END)
+        self._flush_appends()
+        if self._doc is not None:
+            self._doc.clear()
+            self.large_doc_var.set(False)
+            self._leave_large_doc()
+        else:
+            self.builder_text.delete("1.0", tk.END)
         self.status.set("Builder cleared.")
 
+    def _builder_chunks(self):
+        """Builder contents as a list of string chunks, taken on the Tk thread.
+
+        The newline Tk keeps after the text is left out, so the result is the
+        same in and out of large-document mode.
+        """
+        self._flush_appends()
+        if self._doc is not None:
+            return self._doc.chunks()
+        return [self.builder_text.get("1.0", "end-1c")]
+
     def _save_to_txt(self):
-        text = self.builder_text.get("1.0", tk.END)
-        if not text.strip():
+        from tkinter import filedialog, messagebox
+        if self._save_cancel is not None:
+            self.status.set("A save is already in progress.")
+            return
+        chunks = self._builder_chunks()
+        if not any(chunk.strip() for chunk in chunks):
             if not messagebox.askyesno("Empty Text", "Builder is empty. Save an empty file?"):
                 return
         path = filedialog.asksaveasfilename(title="Save as .txt", defaultextension=".txt",
                                             filetypes=[("Text Files", "*.txt"), ("All Files", "*.*")])
         if not path:
             return
-        try:
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(text)
-            self.status.set(f"Saved: {path}")
-        except Exception as e:
-            messagebox.showerror("Save Error", f"Could not save file:\n{e}")
+        self._start_save(path, chunks, sum(len(c) for c in chunks))
+
+    def _export(self):
+        from tkinter import filedialog, messagebox
+        if self._save_cancel is not None:
+            self.status.set("A save is already in progress.")
+            return
+        fmt = self._export_formats[self.export_var.get()]
+        chunks = self._builder_chunks()
+        if not any(chunks):
+            messagebox.showinfo("Empty Text", "Builder is empty. Nothing to export.")
+            return
+        path = filedialog.asksaveasfilename(title=f"Export as {fmt.label}", defaultextension=fmt.extension,
+                                            filetypes=[(fmt.label, "*" + fmt.extension), ("All Files", "*.*")])
+        if not path:
+            return
+        self._start_save(path, chunks, sum(len(c) for c in chunks), fmt)
+
+    def _start_save(self, path, chunks, total, fmt=None):
+        """Write ``chunks`` (encoded with export format ``fmt``, if given) on a worker
+        thread via write_atomic, reporting progress in the status bar."""
+        from tkinter import messagebox
+        cancel = self._save_cancel = threading.Event()
+        self._cancel_save_btn.config(state=tk.NORMAL)
+        progress = [0]
+        result = {}
+
+        def report(done, _total):
+            progress[0] = done
+
+        def work():
+            try:
+                if fmt is None:
+                    write_atomic(path, chunks, total, report, cancel)
+                else:
+                    write_atomic(path, export_chunks(chunks, fmt, report), cancel=cancel)
+            except Exception as e:
+                result["error"] = e
+
+        # not a daemon: the interpreter must not kill a save half-way through
+        worker = self._save_worker = threading.Thread(target=work)
+        worker.start()
+
+        def poll():
+            if worker.is_alive():
+                pct = progress[0] * 100 // total if total else 0
+                self.status.set(f"Saving {path}… {pct}%")
+                self.after(100, poll)
+                return
+            self._save_cancel = None
+            self._save_worker = None
+            self._cancel_save_btn.config(state=tk.DISABLED)
+            error = result.get("error")
+            if self._close_after_save:
+                if error is not None and not isinstance(error, SaveCancelled):
+                    messagebox.showerror("Save Error", f"Could not save file:\n{error}")
+                self._on_close()
+                return
+            if error is None:
+                self.status.set(f"Saved: {path}")
+            elif isinstance(error, SaveCancelled):
+                self.status.set("Save cancelled; the file was not changed.")
+            else:
+                self.status.set("Save failed.")
+                messagebox.showerror("Save Error", f"Could not save file:\n{error}")
+        poll()
+
+    def _cancel_save(self):
+        if self._save_cancel is not None:
+            self._save_cancel.set()
+            self.status.set("Cancelling save…")
+
+    # ---------------------------- Large-document mode ---------------------------- #
+
+    def _on_large_doc_toggled(self):
+        self._flush_appends()
+        if self.large_doc_var.get():
+            self._enter_large_doc()
+        else:
+            self._leave_large_doc()
+
+    def _builder_chars(self) -> int:
+        n = self.builder_text.count("1.0", "end-1c", "chars")
+        # tkinter returns (n,) -- or None when n is 0 -- unless return_ints is used (3.13+)
+        if isinstance(n, tuple):
+            n = n[0]
+        return n or 0
+
+    def _enter_large_doc(self):
+        if self._doc is not None:
+            return
+        self._doc = TextBuffer(self.builder_text.get("1.0", "end-1c"))
+        self.builder_text.config(wrap=tk.NONE)
+        self._doc_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, before=self.builder_text)
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.builder_text.bind(seq, self._doc_wheel)
+        self._doc_render(len(self._doc))
+        self.status.set(f"Large document mode: {len(self._doc):,} characters, view is read-only.")
+
+    def _leave_large_doc(self):
+        if self._doc is None:
+            return
+        doc, self._doc = self._doc, None
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.builder_text.unbind(seq)
+        self._doc_scrollbar.pack_forget()
+        self.builder_text.config(state=tk.NORMAL, wrap=tk.WORD)
+        self.builder_text.delete("1.0", tk.END)
+        self.builder_text.insert("1.0", doc.getvalue())
+        self.status.set("Large document mode off.")
+
+    def _doc_append(self, text):
+        at_end = self._doc_view + DOC_VIEW_CHARS >= len(self._doc)
+        self._doc.append(text)
+        if at_end:  # follow the tail, like a normal append would
+            self._doc_render(len(self._doc))
+        else:
+            self._doc_update_scrollbar()
+
+    def _doc_render(self, view):
+        """Render the DOC_VIEW_CHARS window starting near ``view`` (clamped to the document)."""
+        doc = self._doc
+        self._doc_view = max(0, min(view, len(doc) - DOC_VIEW_CHARS))
+        t = self.builder_text
+        t.config(state=tk.NORMAL)
+        t.delete("1.0", tk.END)
+        t.insert("1.0", doc.slice(self._doc_view, self._doc_view + DOC_VIEW_CHARS))
+        t.config(state=tk.DISABLED)
+        if self._doc_view + DOC_VIEW_CHARS >= len(doc):
+            t.see(tk.END)
+        self._doc_update_scrollbar()
+
+    def _doc_update_scrollbar(self):
+        n = max(len(self._doc), 1)
+        self._doc_scrollbar.set(self._doc_view / n, min(1.0, (self._doc_view + DOC_VIEW_CHARS) / n))
+
+    def _doc_scroll(self, action, amount, what=None):
+        if action == "moveto":
+            self._doc_render(int(float(amount) * len(self._doc)))
+        else:
+            step = DOC_VIEW_CHARS // 2 if what == "pages" else DOC_SCROLL_UNIT
+            self._doc_render(self._doc_view + int(amount) * step)
+
+    def _doc_wheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self._doc_scroll("scroll", -3, "units")
+        else:
+            self._doc_scroll("scroll", 3, "units")
+        return "break"
 
     # ---------------------------- Search ---------------------------- #
 
-    def _do_search(self):
+    def _on_search_typed(self, *_):
+        if self._search_after is not None:
+            self.after_cancel(self._search_after)
+        self._search_after = self.after(SEARCH_DEBOUNCE_MS, self._do_search)
+
+    def _cancel_search(self):
+        if self._search_after is not None:
+            self.after_cancel(self._search_after)
+            self._search_after = None
+        self._metadata.cancel("search")
+
+    def _do_search(self, _event=None):
+        self._cancel_search()
         q = self.search_var.get().strip().lower()
         if not q:
-            self._clear_search()
+            self._hide_search_results()
             return
-        results = []
-        for cat, items in CATEGORIES.items():
-            for ch in items:
-                name = ""
-                try:
-                    name = unicodedata.name(ch).lower()
-                except ValueError:
-                    pass
-                if q in ch.lower() or (name and q in name):
-                    results.append((ch, cat))
-        self._show_search_results(results, q)
+        # ranked fuzzy match (see NameIndex.ranked) over unique symbol ids, best
+        # first; a newer query cancels this one
+        self._request_metadata(("search", q), lambda: catalogue_index().ranked(q, SEARCH_RESULTS),
+                               partial(self._show_ranked, q), channel="search")
+
+    def _show_ranked(self, query, ids):
+        symbols = symbol_table().symbols
+        self._show_search_results([symbols[i] for i in ids], query)
+
+    def _hide_search_results(self):
+        if self.search_tab is not None:
+            self.tabs.hide(self.search_tab)
 
     def _clear_search(self):
         self.search_var.set("")
-        if self.search_tab is not None:
-            idx = self.tabs.index(self.search_tab)
-            self.tabs.forget(idx)
-            self.search_tab = None
+        self._cancel_search()  # drop the debounce the write trace just scheduled
+        self._hide_search_results()
         self.status.set("Search cleared.")
 
-    def _show_search_results(self, results, query):
-        if self.search_tab is not None:
-            idx = self.tabs.index(self.search_tab)
-            self.tabs.forget(idx)
-            self.search_tab = None
-        frame = self._make_scrollable_category(self.tabs, "Search Results", [ch for ch, _ in results])
-        count = len(results)
+    def _show_search_results(self, chars, query):
+        count = len(chars)
         label = f"Search: '{query}' ({count} result{'s' if count != 1 else ''})"
-        self.search_tab = frame
-        self.tabs.add(frame, text=label)
-        self.tabs.select(frame)
+        if self.search_tab is None:
+            self.search_tab = self._search_grid = self._make_scrollable_category(self.tabs, "Search Results", chars)
+            self.tabs.add(self.search_tab, text=label)
+        else:
+            self._search_grid.set_items(chars)
+            self.tabs.tab(self.search_tab, text=label, state="normal")  # un-hides it too
+        self.tabs.select(self.search_tab)
         self.status.set(label)
 
 # ---------------------------- main ---------------------------- #
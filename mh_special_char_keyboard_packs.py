@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+mh_special_char_keyboard_packs.py
+
+User-defined category packs: extra symbol categories loaded from JSON or
+TOML files in the ``packs`` folder of the user config directory, e.g.
+``~/.config/mh_special_char_keyboard/packs/in_house.toml``:
+
+    [categories]
+    "Logos" = "™®©℠"
+    "Units" = ["㎏", "㎡", "U+2103"]
+
+or the same as JSON: ``{"categories": {"Logos": "™®©℠", ...}}``. A category
+is a string of symbols or a list of symbols / ``U+XXXX`` code points; a
+symbol is a single code point. Optional top-level keys ``name``,
+``description`` and ``version`` are ignored. Packs are read in file name
+order; a pack that fails validation is skipped as a whole and reported.
+
+Each pack is validated and compiled to ``(category, symbols string)``
+pairs once; the results are kept in ``packs.cache`` in the user cache
+directory together with the file's mtime, size and SHA-256, so an unchanged
+run only stats the pack files and unmarshals the cache. A pack whose mtime
+changed but whose contents did not is recognised by its hash.
+"""
+
+import marshal
+import os
+import sys
+from collections import namedtuple
+
+from mh_special_char_keyboard_core import user_cache_dir, user_config_dir, write_bytes_atomic
+
+PACKS_DIRNAME = "packs"
+PACK_CACHE_FILENAME = "packs.cache"
+PACK_SUFFIXES = (".json", ".toml")
+PACK_CACHE_FORMAT = 1
+_OPTIONAL_KEYS = {"name", "description", "version"}
+
+LoadedPacks = namedtuple("LoadedPacks", "categories errors digests")
+
+
+class PackError(ValueError):
+    """A category pack that cannot be used; the message says why."""
+
+
+def default_packs_dir() -> str:
+    return os.path.join(user_config_dir(), PACKS_DIRNAME)
+
+
+def default_pack_cache_path() -> str:
+    return os.path.join(user_cache_dir(), PACK_CACHE_FILENAME)
+
+# ---------------------------- Validation ---------------------------- #
+
+def _parse(data: bytes, suffix: str):
+    text = data.decode("utf-8-sig")
+    if suffix == ".json":
+        import json
+        try:
+            return json.loads(text)
+        except ValueError as e:
+            raise PackError(f"invalid JSON: {e}") from None
+    try:
+        import tomllib
+    except ImportError:  # Python < 3.11
+        try:
+            import tomli as tomllib
+        except ImportError:
+            raise PackError("TOML packs need Python 3.11+ or the 'tomli' package") from None
+    try:
+        return tomllib.loads(text)
+    except tomllib.TOMLDecodeError as e:
+        raise PackError(f"invalid TOML: {e}") from None
+
+
+def _symbol(item, cat):
+    if isinstance(item, str) and item[:2] in ("U+", "u+"):
+        try:
+            cp = int(item[2:], 16)
+        except ValueError:
+            raise PackError(f"category {cat!r}: bad code point {item!r}") from None
+        if not 0 <= cp <= 0x10FFFF:
+            raise PackError(f"category {cat!r}: code point out of range {item!r}")
+        item = chr(cp)
+    if not isinstance(item, str) or len(item) != 1:
+        raise PackError(f"category {cat!r}: {item!r} is not a single character or U+XXXX code point")
+    if 0xD800 <= ord(item) <= 0xDFFF:
+        raise PackError(f"category {cat!r}: surrogate code point {item!r}")
+    return item
+
+
+def compile_pack(data: bytes, suffix: str, reserved=()):
+    """Validate a pack file's contents and return its ``(category, symbols)`` pairs.
+
+    ``reserved`` holds category names already taken. Raises PackError.
+    """
+    pack = _parse(data, suffix)
+    if not isinstance(pack, dict) or not isinstance(pack.get("categories"), dict):
+        raise PackError("expected a 'categories' table mapping names to symbols")
+    unknown = set(pack) - _OPTIONAL_KEYS - {"categories"}
+    if unknown:
+        raise PackError(f"unknown keys: {', '.join(sorted(unknown))}")
+    compiled = []
+    for cat, symbols in pack["categories"].items():
+        if not isinstance(cat, str) or not cat.strip():
+            raise PackError(f"bad category name {cat!r}")
+        if cat in reserved:
+            raise PackError(f"category {cat!r} is already defined")
+        if isinstance(symbols, str):
+            symbols = list(symbols)
+        if not isinstance(symbols, list) or not symbols:
+            raise PackError(f"category {cat!r}: expected a non-empty string or list of symbols")
+        compiled.append((cat, "".join(_symbol(item, cat) for item in symbols)))
+    return tuple(compiled)
+
+# ---------------------------- Loading & cache ---------------------------- #
+
+def _read_cache(path):
+    try:
+        with open(path, "rb") as f:
+            cache = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("format") != (PACK_CACHE_FORMAT, sys.version_info[:2]):
+        return {}
+    return cache.get("packs", {})
+
+
+def load_packs(folder=None, cache_path=None, reserved=()) -> LoadedPacks:
+    """Categories of every pack in ``folder``, in file name order, plus error
+    messages and the SHA-256 digests of the packs that were used.
+
+    Each entry of the cache maps a pack path to ``(mtime_ns, size, sha256,
+    categories, error)``; failures are cached as well, so a broken pack is
+    not re-parsed until it changes.
+    """
+    folder = folder or default_packs_dir()
+    cache_path = cache_path or default_pack_cache_path()
+    try:
+        with os.scandir(folder) as it:
+            entries = sorted((e for e in it if e.name.endswith(PACK_SUFFIXES) and e.is_file()),
+                             key=lambda e: e.name)
+    except OSError:  # no packs folder
+        return LoadedPacks((), [], ())
+
+    cached = _read_cache(cache_path)
+    fresh = {}
+    taken = set(reserved)
+    categories = []
+    errors = []
+    digests = []
+    for entry in entries:
+        try:
+            st = entry.stat()
+            hit = cached.get(entry.path)
+            if hit is not None and hit[:2] == (st.st_mtime_ns, st.st_size):
+                digest, compiled, error = hit[2:]
+            else:
+                import hashlib  # only needed when a pack is new or has changed
+                with open(entry.path, "rb") as f:
+                    data = f.read()
+                digest = hashlib.sha256(data).hexdigest()
+                if hit is not None and hit[2] == digest:
+                    compiled, error = hit[3:]
+                else:
+                    try:
+                        compiled, error = compile_pack(data, os.path.splitext(entry.name)[1], reserved), None
+                    except (PackError, UnicodeDecodeError) as e:
+                        compiled, error = (), str(e)
+        except OSError as e:
+            errors.append(f"{entry.path}: {e}")
+            continue
+        fresh[entry.path] = (st.st_mtime_ns, st.st_size, digest, compiled, error)
+        # category names must also be unique across packs
+        clash = [cat for cat, _symbols in compiled if cat in taken]
+        if error is None and clash:
+            error = f"category {clash[0]!r} is already defined"
+        if error is not None:
+            errors.append(f"{entry.path}: {error}")
+            continue
+        taken.update(cat for cat, _symbols in compiled)
+        categories.extend(compiled)
+        digests.append(digest)
+
+    if fresh != cached:
+        try:
+            write_bytes_atomic(cache_path, marshal.dumps(
+                {"format": (PACK_CACHE_FORMAT, sys.version_info[:2]), "packs": fresh}))
+        except OSError:
+            pass  # read-only cache folder: packs still load, just not cached
+    return LoadedPacks(tuple(categories), errors, tuple(digests))
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""
+mh_special_char_keyboard_search.py
+
+Inverted token index over Unicode character names.
+
+Names are split into lower-case words ("LEFTWARDS ARROW" -> "leftwards",
+"arrow"); each word maps to a sorted posting list of symbol ids, and the
+words are also kept in a sorted array so a query word can match every token
+it is a prefix of. A query matches a symbol when every query word prefixes
+one of the symbol's name words, or when the query is the symbol itself.
+
+``NameIndex.ranked`` adds fuzzy, scored matching on top: each query word
+scores the name words it equals, prefixes or is one typo away from (found
+through a table of one-character deletions of every name word), a
+single-word query also matches name initials ("lsqm" -> LEFT SINGLE
+QUOTATION MARK), and the best ``k`` symbols are picked with a heap.
+"""
+
+import heapq
+from array import array
+from bisect import bisect_left
+
+# Scores of one query word against one name word; a symbol's score is the
+# sum over the query words, each taking its best name word.
+SCORE_EXACT = 10.0
+SCORE_PREFIX = 5.0        # plus up to 3 for covering more of the name word
+SCORE_TYPO = 3.0          # one insertion, deletion, substitution or swap
+SCORE_ACRONYM = 9.0       # the query is exactly the name's initials
+SCORE_ACRONYM_PREFIX = 6.0
+SCORE_CHAR = 100.0        # the query is the symbol itself
+TYPO_MIN_LEN = 4          # shorter words only match exactly or by prefix
+
+
+def name_tokens(name: str):
+    return name.lower().replace("-", " ").split()
+
+
+def _deletions(word):
+    return {word[:i] + word[i + 1:] for i in range(len(word))}
+
+
+def typo_distance(a: str, b: str) -> int:
+    """Optimal string alignment distance (Levenshtein plus adjacent swaps)."""
+    prev2, prev = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        prev2, prev = prev, cur
+    return prev[-1]
+
+
+class NameIndex:
+    """Search index over a fixed sequence of symbols.
+
+    Symbol ids are positions in the ``chars`` sequence given to the
+    constructor; ``search`` returns matching ids in ascending order.
+    """
+
+    def __init__(self, chars, names=None):
+        if names is None:
+            import unicodedata
+            names = [unicodedata.name(ch, "") for ch in chars]
+        postings = {}
+        by_char = {}
+        id_tokens = []
+        for i, (ch, name) in enumerate(zip(chars, names)):
+            tokens = tuple(dict.fromkeys(name_tokens(name)))
+            id_tokens.append(tokens)
+            for tok in tokens:
+                postings.setdefault(tok, array("I")).append(i)
+            by_char.setdefault(ch.lower(), array("I")).append(i)
+        self._postings = postings
+        self._tokens = sorted(postings)
+        self._by_char = by_char
+        self._id_tokens = id_tokens
+        self._deletes = None   # for typos: deletion variant -> name words; built on first use
+        self._acronyms = None  # (sorted initials, initials -> ids); built on first use
+
+    def __len__(self):
+        return len(self._id_tokens)
+
+    def _prefix_postings(self, word):
+        tokens = self._tokens
+        i = bisect_left(tokens, word)
+        lists = []
+        while i < len(tokens) and tokens[i].startswith(word):
+            lists.append(self._postings[tokens[i]])
+            i += 1
+        return lists
+
+    def search(self, query: str):
+        """Sorted ids of exact and word-prefix matches, unranked (no typos or
+        initials). The app uses ``ranked``; this is kept as the baseline for
+        benchmarks/bench_search.py."""
+        q = query.strip().lower()
+        if not q:
+            return []
+        hits = set(self._by_char.get(q, ()))
+        # rarest word first, so later words only ever narrow a small set
+        terms = sorted(((w, self._prefix_postings(w)) for w in name_tokens(q)),
+                       key=lambda term: sum(len(p) for p in term[1]))
+        if not terms or not terms[0][1]:
+            return sorted(hits)
+        matches = set()
+        for p in terms[0][1]:
+            matches.update(p)
+        for word, lists in terms[1:]:
+            if not matches:
+                break
+            if sum(len(p) for p in lists) <= len(matches):
+                union = set()
+                for p in lists:
+                    union.update(p)
+                matches &= union
+            else:
+                # cheaper to check the few remaining candidates directly
+                matches = {i for i in matches
+                           if any(t.startswith(word) for t in self._id_tokens[i])}
+        return sorted(hits | matches)
+
+    # -- ranked, fuzzy search --
+
+    def _typo_table(self):
+        if self._deletes is None:
+            deletes = {}
+            for tok in self._tokens:
+                # skip code-like words ("4e00" of CJK UNIFIED IDEOGRAPH-4E00): a
+                # typo there is a different character, and they are most words
+                if len(tok) >= TYPO_MIN_LEN - 1 and tok.isalpha():
+                    for variant in _deletions(tok) | {tok}:
+                        deletes.setdefault(variant, []).append(tok)
+            self._deletes = deletes
+        return self._deletes
+
+    def _acronym_table(self):
+        if self._acronyms is None:
+            by_initials = {}
+            for i, tokens in enumerate(self._id_tokens):
+                if len(tokens) > 1:
+                    by_initials.setdefault("".join(t[0] for t in tokens), array("I")).append(i)
+            self._acronyms = (sorted(by_initials), by_initials)
+        return self._acronyms
+
+    def _word_scores(self, word):
+        """Name words matched by query ``word`` -> score of that match."""
+        scores = {}
+        tokens = self._tokens
+        i = bisect_left(tokens, word)
+        while i < len(tokens) and tokens[i].startswith(word):
+            tok = tokens[i]
+            scores[tok] = SCORE_EXACT if tok == word else SCORE_PREFIX + 3.0 * len(word) / len(tok)
+            i += 1
+        if len(word) >= TYPO_MIN_LEN:
+            # a word within one edit shares a deletion variant with it (or is one)
+            table = self._typo_table()
+            for variant in _deletions(word) | {word}:
+                for tok in table.get(variant, ()):
+                    if tok not in scores and typo_distance(word, tok) <= 1:
+                        scores[tok] = SCORE_TYPO
+        return scores
+
+    def _acronym_scores(self, word):
+        keys, by_initials = self._acronym_table()
+        scores = {}
+        i = bisect_left(keys, word)
+        while i < len(keys) and keys[i].startswith(word):
+            score = SCORE_ACRONYM if keys[i] == word else SCORE_ACRONYM_PREFIX
+            for sid in by_initials[keys[i]]:
+                scores[sid] = score
+            i += 1
+        return scores
+
+    def ranked(self, query: str, k: int = 200):
+        """Ids of the best ``k`` matches for ``query``, best first.
+
+        Every query word has to match some name word (exactly, as a prefix or
+        with one typo); scores add up over the words. Ties go to shorter
+        names, then to lower ids.
+        """
+        q = query.strip().lower()
+        if not q or k <= 0:
+            return []
+        words = sorted(((w, self._word_scores(w)) for w in dict.fromkeys(name_tokens(q))),
+                       key=lambda term: sum(len(self._postings[t]) for t in term[1]))
+        scores = {}
+        if words and words[0][1]:
+            # rarest word first; later words only rescore the surviving ids
+            word, matched = words[0]
+            for tok, score in matched.items():
+                for i in self._postings[tok]:
+                    if scores.get(i, 0.0) < score:
+                        scores[i] = score
+            for word, matched in words[1:]:
+                if not scores:
+                    break
+                rescored = {}
+                for i, total in scores.items():
+                    best = max((matched.get(t, 0.0) for t in self._id_tokens[i]), default=0.0)
+                    if best:
+                        rescored[i] = total + best
+                scores = rescored
+        if len(words) == 1 and len(q) >= 2 and q.isalpha():
+            for i, score in self._acronym_scores(q).items():
+                if scores.get(i, 0.0) < score:
+                    scores[i] = score
+        for i in self._by_char.get(q, ()):
+            scores[i] = scores.get(i, 0.0) + SCORE_CHAR
+        id_tokens = self._id_tokens
+        best = heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -len(id_tokens[item[0]]), -item[0]))
+        return [i for i, _ in best]
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+mh_special_char_keyboard_unicode.py
+
+Prebuilt, on-disk index of the assigned Unicode repertoire for the
+"All Characters" browser.
+
+Build the index once (the app also offers to do it from the browser tab):
+
+    python mh_special_char_keyboard_unicode.py [--output PATH]
+
+Index file layout (little endian):
+- 8 byte magic ``MHSCKUI1`` followed by a uint32 header length
+- a JSON header: Unicode version, record count, block and category tables
+- ``count`` fixed-size records ``(code point u32, name offset u32, block u16, category u8, pad)``
+- a blob of ASCII names separated by newlines
+
+Only the header is parsed on open; records and names are read from a memory
+map on demand, so opening the index costs the same whatever its size.
+Controls (Cc), surrogates (Cs), private use (Co) and unassigned (Cn) code
+points are left out.
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+from array import array
+
+from mh_special_char_keyboard_blocks import block_of
+from mh_special_char_keyboard_core import user_cache_dir, write_bytes_atomic
+
+MAGIC = b"MHSCKUI1"
+INDEX_FILENAME = "unicode_index.bin"
+EXCLUDED_CATEGORIES = {"Cc", "Cs", "Co", "Cn"}
+
+_RECORD = struct.Struct("<IIHBx")
+_HEADER_LEN = struct.Struct("<I")
+
+GENERAL_CATEGORIES = {
+    "Lu": "Letter, uppercase",
+    "Ll": "Letter, lowercase",
+    "Lt": "Letter, titlecase",
+    "Lm": "Letter, modifier",
+    "Lo": "Letter, other",
+    "Mn": "Mark, nonspacing",
+    "Mc": "Mark, spacing combining",
+    "Me": "Mark, enclosing",
+    "Nd": "Number, decimal digit",
+    "Nl": "Number, letter",
+    "No": "Number, other",
+    "Pc": "Punctuation, connector",
+    "Pd": "Punctuation, dash",
+    "Ps": "Punctuation, open",
+    "Pe": "Punctuation, close",
+    "Pi": "Punctuation, initial quote",
+    "Pf": "Punctuation, final quote",
+    "Po": "Punctuation, other",
+    "Sm": "Symbol, math",
+    "Sc": "Symbol, currency",
+    "Sk": "Symbol, modifier",
+    "So": "Symbol, other",
+    "Zs": "Separator, space",
+    "Zl": "Separator, line",
+    "Zp": "Separator, paragraph",
+    "Cc": "Other, control",
+    "Cf": "Other, format",
+    "Cs": "Other, surrogate",
+    "Co": "Other, private use",
+    "Cn": "Other, not assigned",
+}
+
+# ---------------------------- Locations ---------------------------- #
+
+def default_index_path() -> str:
+    return os.path.join(user_cache_dir(), INDEX_FILENAME)
+
+# ---------------------------- Build step ---------------------------- #
+
+def build_index(path=None) -> str:
+    """Scan ``unicodedata`` once and write the index file. Returns the path written."""
+    import unicodedata
+
+    path = path or default_index_path()
+    block_ids = {}
+    blocks = []       # [name, first record, end record]
+    categories = []
+    category_ids = {}
+    records = bytearray()
+    names = bytearray()
+    count = 0
+    for cp in range(0x110000):
+        ch = chr(cp)
+        gc = unicodedata.category(ch)
+        if gc in EXCLUDED_CATEGORIES:
+            continue
+        block = block_of(cp)
+        if block not in block_ids:
+            block_ids[block] = len(blocks)
+            blocks.append([block, count, count])
+        blocks[block_ids[block]][2] = count + 1
+        if gc not in category_ids:
+            category_ids[gc] = len(categories)
+            categories.append(gc)
+        records += _RECORD.pack(cp, len(names), block_ids[block], category_ids[gc])
+        names += unicodedata.name(ch, "").encode("ascii") + b"\n"
+        count += 1
+
+    header = json.dumps({
+        "unidata_version": unicodedata.unidata_version,
+        "count": count,
+        "blocks": blocks,
+        "categories": categories,
+    }).encode("utf-8")
+
+    write_bytes_atomic(path, b"".join((MAGIC, _HEADER_LEN.pack(len(header)), header, records, names)))
+    return path
+
+# ---------------------------- Reader ---------------------------- #
+
+class UnicodeIndex:
+    """Read-only, memory-mapped view of an index file.
+
+    Behaves as a sequence of characters (``len(idx)``, ``idx[i]``) so it can
+    be handed straight to a SymbolGrid; ``record(i)`` gives the full entry.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:len(MAGIC)] != MAGIC:
+            self._mm.close()
+            raise ValueError(f"Not a Unicode index file: {path}")
+        (hlen,) = _HEADER_LEN.unpack_from(self._mm, len(MAGIC))
+        start = len(MAGIC) + _HEADER_LEN.size
+        header = json.loads(self._mm[start:start + hlen].decode("utf-8"))
+        self.unidata_version = header["unidata_version"]
+        self.count = header["count"]
+        self.blocks = [tuple(b) for b in header["blocks"]]
+        self.categories = header["categories"]
+        self._records = start + hlen
+        self._names = self._records + self.count * _RECORD.size
+        self._category_cache = {}
+
+    def close(self):
+        self._mm.close()
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        return chr(self.codepoint(i))
+
+    def codepoint(self, i: int) -> int:
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        return _RECORD.unpack_from(self._mm, self._records + i * _RECORD.size)[0]
+
+    def record(self, i: int):
+        """(code point, name, block name, general category) of record ``i``."""
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        cp, name_off, block, gc = _RECORD.unpack_from(self._mm, self._records + i * _RECORD.size)
+        start = self._names + name_off
+        end = self._mm.find(b"\n", start)
+        return cp, self._mm[start:end].decode("ascii"), self.blocks[block][0], self.categories[gc]
+
+    def category_indices(self, gc: str) -> array:
+        """Record numbers with general category ``gc`` (computed once per category)."""
+        if gc not in self._category_cache:
+            gc_id = self.categories.index(gc) if gc in self.categories else -1
+            # the category byte of every record, as one strided slice
+            column = self._mm[self._records + 10:self._names:_RECORD.size]
+            self._category_cache[gc] = array("I", (i for i, g in enumerate(column) if g == gc_id))
+        return self._category_cache[gc]
+
+    def view(self, block=None, category=None):
+        """Sequence of characters restricted to a block name and/or general category."""
+        lo, hi = 0, self.count
+        if block is not None:
+            for name, first, end in self.blocks:
+                if name == block:
+                    lo, hi = first, end
+                    break
+            else:
+                lo = hi = 0
+        if category is None:
+            return IndexView(self, range(lo, hi))
+        rows = self.category_indices(category)
+        if (lo, hi) != (0, self.count):
+            rows = [i for i in rows if lo <= i < hi]
+        return IndexView(self, rows)
+
+
+class IndexView:
+    """A filtered window onto a UnicodeIndex; maps positions to record numbers."""
+
+    def __init__(self, index, rows):
+        self.index = index
+        self.rows = rows
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, i):
+        return self.index[self.rows[i]]
+
+    def record(self, i):
+        return self.index.record(self.rows[i])
+
+
+def load_index(path=None):
+    """Open the index, or return None if it is missing, unreadable or was built
+    for a different Unicode version than this Python's ``unicodedata``."""
+    import unicodedata
+
+    path = path or default_index_path()
+    try:
+        index = UnicodeIndex(path)
+    except (OSError, ValueError):
+        return None
+    if index.unidata_version != unicodedata.unidata_version:
+        index.close()
+        return None
+    return index
+
+# ---------------------------- main ---------------------------- #
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the Unicode code point index.")
+    parser.add_argument("--output", default=None, help=f"index file (default: {default_index_path()})")
+    args = parser.parse_args(argv)
+    path = build_index(args.output)
+    print(f"Wrote {path}")
+
+if __name__ == "__main__":
+    main()